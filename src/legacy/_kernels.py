@@ -0,0 +1,252 @@
+"""
+Numeric kernels behind the technical indicators in serve.py.
+
+They are plain loops over float64 arrays so numba can compile them to machine code. numba is an
+optional dependency (pip install stockfetch[numba]); without it the EMA kernels fall back to
+scipy.signal.lfilter and the rest run as Python loops, which on the few hundred rows of an NSE
+history are still cheaper than a pandas rolling/ewm call.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as is."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def ewm_adjust_false(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted mean, same as pd.Series(x).ewm(alpha=alpha, adjust=False).mean().
+
+    :param x: float64 array.
+    :param alpha: Smoothing factor, 2 / (span + 1) for a span-based EMA.
+    :return: float64 array of the same length.
+    """
+    y = np.empty_like(x)
+    y[0] = x[0]
+    for i in range(1, len(x)):
+        y[i] = alpha * x[i] + (1.0 - alpha) * y[i - 1]
+    return y
+
+
+@njit(cache=True, fastmath=True)
+def macd_lines(
+    x: np.ndarray, fast_alpha: float, slow_alpha: float, signal_alpha: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line (fast EMA - slow EMA), its signal EMA and the histogram (MACD - signal) in one pass,
+    with the same adjust=False recursion as ewm_adjust_false.
+
+    :param x: float64 array of closing prices.
+    :param fast_alpha: Smoothing factor of the fast EMA (2 / 13 for the standard 12 periods).
+    :param slow_alpha: Smoothing factor of the slow EMA (2 / 27 for 26 periods).
+    :param signal_alpha: Smoothing factor of the signal EMA (2 / 10 for 9 periods).
+    :return: (macd, signal, histogram) arrays of the same length as x.
+    """
+    macd = np.empty_like(x)
+    signal = np.empty_like(x)
+    fast = slow = x[0]
+    macd[0] = signal[0] = 0.0
+    for i in range(1, len(x)):
+        fast = fast_alpha * x[i] + (1.0 - fast_alpha) * fast
+        slow = slow_alpha * x[i] + (1.0 - slow_alpha) * slow
+        macd[i] = fast - slow
+        signal[i] = signal_alpha * macd[i] + (1.0 - signal_alpha) * signal[i - 1]
+    return macd, signal, macd - signal
+
+
+if not NUMBA_AVAILABLE:
+    # Without numba the EMA recursions run as one scipy IIR filter call instead of a Python loop:
+    # y[i] = alpha * x[i] + (1 - alpha) * y[i - 1], started from y[0] = x[0]
+    from scipy.signal import lfilter
+
+    def ewm_adjust_false(x: np.ndarray, alpha: float) -> np.ndarray:
+        """
+        Exponentially weighted mean, same as pd.Series(x).ewm(alpha=alpha, adjust=False).mean().
+
+        :param x: float64 array.
+        :param alpha: Smoothing factor, 2 / (span + 1) for a span-based EMA.
+        :return: float64 array of the same length.
+        """
+        y, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[x[0] * (1.0 - alpha)])
+        return y
+
+    def macd_lines(
+        x: np.ndarray, fast_alpha: float, slow_alpha: float, signal_alpha: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        MACD line (fast EMA - slow EMA), its signal EMA and the histogram (MACD - signal).
+
+        :param x: float64 array of closing prices.
+        :param fast_alpha: Smoothing factor of the fast EMA (2 / 13 for the standard 12 periods).
+        :param slow_alpha: Smoothing factor of the slow EMA (2 / 27 for 26 periods).
+        :param signal_alpha: Smoothing factor of the signal EMA (2 / 10 for 9 periods).
+        :return: (macd, signal, histogram) arrays of the same length as x.
+        """
+        macd = ewm_adjust_false(x, fast_alpha) - ewm_adjust_false(x, slow_alpha)
+        signal = ewm_adjust_false(macd, signal_alpha)
+        return macd, signal, macd - signal
+
+
+@njit(cache=True)
+def wilder_rsi(gains: np.ndarray, losses: np.ndarray, days: int) -> float:
+    """
+    Relative Strength Index with Wilder's smoothing: the averages are seeded with the mean of the
+    first `days` values and then updated as avg = (avg * (days - 1) + value) / days.
+
+    :param gains: float64 array of non-negative price changes.
+    :param losses: float64 array of non-negative price drops (absolute values).
+    :param days: Smoothing period.
+    :return: RSI of the last value, NaN when there are fewer than `days` values.
+    """
+    if len(gains) < days:
+        return np.nan
+    avg_gain = gains[:days].mean()
+    avg_loss = losses[:days].mean()
+    for i in range(days, len(gains)):
+        avg_gain = (avg_gain * (days - 1) + gains[i]) / days
+        avg_loss = (avg_loss * (days - 1) + losses[i]) / days
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True)
+def wilder_adx(high: np.ndarray, low: np.ndarray, days: int) -> float:
+    """
+    Average Directional Index in one pass: directional movement is Wilder-smoothed into +DI/-DI,
+    and the resulting DX is Wilder-smoothed into the ADX (seeded with the mean of the first
+    `days` DX values).
+
+    +DI and -DI share the same smoothed true range as denominator, which cancels out of
+    DX = |+DI - -DI| / (+DI + -DI), so the true range itself is never needed here.
+
+    :param high: float64 array of daily highs, oldest first.
+    :param low: float64 array of daily lows.
+    :param days: Smoothing period.
+    :return: ADX of the last row, NaN when there are fewer than 2 * days rows.
+    """
+    if len(high) < 2 * days:
+        return np.nan
+    plus_dm_avg = 0.0
+    minus_dm_avg = 0.0
+    adx = 0.0
+    for i in range(1, len(high)):
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        plus_dm = up_move if up_move > down_move and up_move > 0.0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0.0 else 0.0
+
+        if i <= days:
+            # Seed the smoothed values with the plain mean of the first `days` rows
+            plus_dm_avg += plus_dm / days
+            minus_dm_avg += minus_dm / days
+            if i < days:
+                continue
+        else:
+            plus_dm_avg = (plus_dm_avg * (days - 1) + plus_dm) / days
+            minus_dm_avg = (minus_dm_avg * (days - 1) + minus_dm) / days
+
+        di_sum = plus_dm_avg + minus_dm_avg
+        dx = 100.0 * abs(plus_dm_avg - minus_dm_avg) / di_sum if di_sum > 0.0 else 0.0
+        if i < 2 * days:
+            adx += dx / days
+        else:
+            adx = (adx * (days - 1) + dx) / days
+    return adx
+
+
+@njit(cache=True)
+def rolling_high_low(high: np.ndarray, low: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling maximum of high and rolling minimum of low in O(n), using monotonic deques of indices
+    (same result as Series.rolling(window).max() / .min(), NaN until the first full window).
+
+    :param high: float64 array of daily highs.
+    :param low: float64 array of daily lows.
+    :param window: Window length in rows.
+    :return: (highest high, lowest low) arrays of the same length as the inputs.
+    """
+    n = len(high)
+    highest = np.full(n, np.nan)
+    lowest = np.full(n, np.nan)
+    # Each index is pushed once, so plain arrays with head/tail cursors are enough for the deques
+    max_queue = np.empty(n, dtype=np.int64)
+    min_queue = np.empty(n, dtype=np.int64)
+    max_head = max_tail = min_head = min_tail = 0
+    for i in range(n):
+        while max_tail > max_head and high[max_queue[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_queue[max_tail] = i
+        max_tail += 1
+        while min_tail > min_head and low[min_queue[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_queue[min_tail] = i
+        min_tail += 1
+
+        if max_queue[max_head] <= i - window:
+            max_head += 1
+        if min_queue[min_head] <= i - window:
+            min_head += 1
+        if i >= window - 1:
+            highest[i] = high[max_queue[max_head]]
+            lowest[i] = low[min_queue[min_head]]
+    return highest, lowest
+
+
+@njit(cache=True)
+def bollinger_bands(x: np.ndarray, window: int, width: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger Bands from running sums of the values and their squares, so mean and sample
+    standard deviation (ddof=1, as in pandas) come out of a single pass over the array.
+
+    :param x: float64 array of closing prices.
+    :param window: Window length in rows.
+    :param width: Number of standard deviations between the middle and the outer bands.
+    :return: (upper, middle, lower) arrays, NaN until the first full window.
+    """
+    n = len(x)
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    if n == 0 or window < 2:
+        return upper, middle, lower
+    # Summing offsets from the first price keeps the sum of squares small and the variance exact
+    shift = x[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        value = x[i] - shift
+        total += value
+        total_sq += value * value
+        if i >= window:
+            old = x[i - window] - shift
+            total -= old
+            total_sq -= old * old
+        if i >= window - 1:
+            mean = total / window
+            std = np.sqrt(max((total_sq - total * mean) / (window - 1), 0.0))
+            middle[i] = mean + shift
+            upper[i] = middle[i] + width * std
+            lower[i] = middle[i] - width * std
+    return upper, middle, lower
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) now rather than on the first indicator call
+    ewm_adjust_false(np.zeros(2), 0.5)
+    macd_lines(np.zeros(2), 0.5, 0.5, 0.5)
+    wilder_rsi(np.zeros(2), np.zeros(2), 1)
+    wilder_adx(np.zeros(2), np.zeros(2), 1)
+    rolling_high_low(np.zeros(2), np.zeros(2), 1)
+    bollinger_bands(np.zeros(2), 2, 2.0)
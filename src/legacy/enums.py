@@ -1,61 +1,62 @@
-from enum import Enum
+from enum import StrEnum
+from typing import Literal
 
 
-class Mode(Enum):
+class Mode(StrEnum):
     LOCAL = "local"
     VPN = "vpn"
 
-class Index(Enum):  # Improved: Use Enums for fixed choices
+class Index(StrEnum):  # Improved: Use Enums for fixed choices
     NIFTY = "NIFTY"
     FINNIFTY = "FINNIFTY"
     BANKNIFTY = "BANKNIFTY"
 
-class HolidayType(Enum):
+class HolidayType(StrEnum):
     TRADING = "trading"
     CLEARING = "clearing"
 
-class ResultPeriod(Enum):
+class ResultPeriod(StrEnum):
     QUARTERLY = "Quarterly"
     ANNUAL = "Annual"
     HALF_YEARLY = "Half-Yearly"
     OTHERS = "Others"
     
-class OptionType(Enum):
+class OptionType(StrEnum):
     CALL = "CE"
     PUT = "PE"
     FUTURES = "Fut"
     
-class InstrumentType(Enum):
+class InstrumentType(StrEnum):
     OPTION_STOCK = "OPTSTK"
     OPTION_INDEX = "OPTIDX"
     FUTURES_STOCK = "FUTSTK"
     FUTURES_INDEX = "FUTIDX"
     EQUITY = "EQ"
     
-class SortType(Enum):
+class SortType(StrEnum):
      VOLUME = "volume"
      VALUE = "value"
 
-class PreopenKey(Enum):
+class PreopenKey(StrEnum):
     NIFTY = "NIFTY"
     FNO = "FO"
     
-class BandType(Enum):
+class BandType(StrEnum):
     UPPER = "upper"
     LOWER = "lower"
     BOTH = "both"
     
-class BandView(Enum):
+class BandView(StrEnum):
     ALL = "AllSec"
     GREATER_THAN_20 = "SecGtr20"
     LESS_THAN_20 = "SecLwr20"
     
-class LargeDealType(Enum):
+class LargeDealType(StrEnum):
     BULK = "bulk_deals"
     SHORT = "short_deals"
     BLOCK = "block_deals"
 
-class MarketSegment(Enum):
+class MarketSegment(StrEnum):
     FO = "FO"  # Futures and Options
     COM = "COM" # Commodity
     CD = "CD"   # Currency Derivatives
@@ -66,3 +67,10 @@ class MarketSegment(Enum):
     NDM = "NDM"   # Negotiated Dealing System
     NTRP = "NTRP" # ?
     SLBS = "SLBS"  # Securities Lending and Borrowing Scheme
+
+
+# Literal aliases for the small enums whose values are all callers ever need. Members
+# are str, so APIs typed with these accept either the member or the bare literal.
+HolidayTypeValue = Literal["trading", "clearing"]
+OptionTypeValue = Literal["CE", "PE", "Fut"]
+BandTypeValue = Literal["upper", "lower", "both"]
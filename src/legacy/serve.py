@@ -1,16 +1,21 @@
 import asyncio
-from functools import cache
+import copy
+from functools import lru_cache
 import os
+import time
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import requests
 import aiohttp
 import pandas as pd
 import json
+import orjson
 import datetime
+import io
 import logging
 import urllib.parse
-from typing import Union, List, Dict
-from scipy.stats import norm
+from typing import BinaryIO, Optional, Union, List, Dict
+from scipy.special import ndtr
 import math
 
 # make this absolute import
@@ -27,6 +32,17 @@ from .enums import (
     BandView,
     LargeDealType,
     MarketSegment,
+    HolidayTypeValue,
+    OptionTypeValue,
+    BandTypeValue,
+)
+from ._kernels import (
+    bollinger_bands,
+    ewm_adjust_false,
+    macd_lines,
+    rolling_high_low,
+    wilder_adx,
+    wilder_rsi,
 )
 
 # Configure logging
@@ -34,14 +50,221 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(funcName)s - %(lineno)d - %(levelname)s - %(message)s"
 )
 
+# On-disk copy of NSE's equity list, refreshed once it is older than the TTL
+EQUITY_LIST_URL = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
+EQUITY_LIST_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "stockfetch", "equity_l.csv")
+EQUITY_LIST_CACHE_TTL = 24 * 60 * 60
+
+PDF_CHUNK_SIZE = 64 * 1024
+
+HISTORICAL_CONCURRENCY = 8
+
+# Bhavcopy columns with a fixed type (NSE pads the header names with a leading space).
+# DELIV_QTY/DELIV_PER hold "-" for non-delivery series, so they are left to inference.
+_BHAV_DTYPES = {
+    " SERIES": "category",
+    " PREV_CLOSE": "float64",
+    " OPEN_PRICE": "float64",
+    " HIGH_PRICE": "float64",
+    " LOW_PRICE": "float64",
+    " LAST_PRICE": "float64",
+    " CLOSE_PRICE": "float64",
+    " AVG_PRICE": "float64",
+    " TTL_TRD_QNTY": "int64",
+    " TURNOVER_LACS": "float64",
+    " NO_OF_TRADES": "int64",
+}
+
+# Numeric columns of the equity history payload, typed once per chunk instead of left to inference
+_EQ_HIST_DTYPES = {
+    "CH_TRADE_HIGH_PRICE": "float64",
+    "CH_TRADE_LOW_PRICE": "float64",
+    "CH_OPENING_PRICE": "float64",
+    "CH_CLOSING_PRICE": "float64",
+    "CH_LAST_TRADED_PRICE": "float64",
+    "CH_PREVIOUS_CLS_PRICE": "float64",
+    "CH_TOT_TRADED_QTY": "float64",
+    "CH_TOT_TRADED_VAL": "float64",
+    "CH_52WEEK_HIGH_PRICE": "float64",
+    "CH_52WEEK_LOW_PRICE": "float64",
+    "CH_TOTAL_TRADES": "float64",
+    "VWAP": "float64",
+}
+
+# Price columns get_equity_history can hand out as float32
+_PRICE_COLUMNS = ("CH_CLOSING_PRICE", "CH_TRADE_HIGH_PRICE", "CH_TRADE_LOW_PRICE")
+
+# get_quote responses are reused for this many seconds (longer while the market is closed)
+QUOTE_CACHE_TTL = 1
+QUOTE_CACHE_TTL_CLOSED = 300
+QUOTE_CACHE_SIZE = 256
+
+# Symbol/index lookup tables built from list endpoints are reused for this many seconds
+INDEXED_PAYLOAD_TTL = 30
+
+# Equity history is kept per symbol for this many seconds and later, narrower ranges are sliced from it
+HISTORY_CACHE_TTL = 300
+
+# Indicators served by compute_indicators: name -> (method, trading days of history it reads)
+INDICATORS = {
+    "sma": ("get_simple_moving_average", 50),
+    "ema": ("get_exponential_moving_average", 50),
+    "dema": ("get_double_exponential_moving_average", 50),
+    "tema": ("get_triple_exponential_moving_average", 50),
+    "rsi": ("get_relative_strength_index", 14),
+    "macd": ("get_moving_average_convergence_divergence", 50),
+    "stochastic": ("get_stochastic_oscillator", 14),
+    "bollinger": ("get_bollinger_bands", 20),
+    "adx": ("get_average_directional_index", 56),
+    "cci": ("get_commodity_channel_index", 40),
+    "ichimoku": ("get_ichimoku_cloud", 52),
+    "fibonacci": ("get_fibonacci_retracement", 50),
+}
+
+# Option-chain leg fields (payload key -> output column) for the CE and PE sides of a strike
+FIELD_MAP_CE = {
+    "openInterest": "CALLS_OI",
+    "changeinOpenInterest": "CALLS_Chng in OI",
+    "totalTradedVolume": "CALLS_Volume",
+    "impliedVolatility": "CALLS_IV",
+    "lastPrice": "CALLS_LTP",
+    "change": "CALLS_Net Chng",
+    "bidQty": "CALLS_Bid Qty",
+    "bidprice": "CALLS_Bid Price",
+    "askPrice": "CALLS_Ask Price",
+    "askQty": "CALLS_Ask Qty",
+}
+FIELD_MAP_PE = {
+    "openInterest": "PUTS_OI",
+    "changeinOpenInterest": "PUTS_Chng in OI",
+    "totalTradedVolume": "PUTS_Volume",
+    "impliedVolatility": "PUTS_IV",
+    "lastPrice": "PUTS_LTP",
+    "change": "PUTS_Net Chng",
+    "bidQty": "PUTS_Bid Qty",
+    "bidprice": "PUTS_Bid Price",
+    "askPrice": "PUTS_Ask Price",
+    "askQty": "PUTS_Ask Qty",
+}
+
+# StrEnum members hash and compare equal to their values, so raw strings test the same way
+_INDEX_VALUES = frozenset(Index)
+_RESULT_PERIODS = frozenset(ResultPeriod)
+
+# Regular session hours of the NSE cash market (IST)
+_MKT_OPEN = datetime.time(9, 15)
+_MKT_CLOSE = datetime.time(15, 30)
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def _parse_nse_date(date_str: str) -> datetime.date:
+    """Parses NSE's fixed "dd-mmm-yyyy" dates without going through strptime."""
+    try:
+        day, month, year = date_str.split("-")
+        return datetime.date(int(year), _MONTHS[month.title()], int(day))
+    except (KeyError, AttributeError) as error:
+        raise ValueError(f"time data {date_str!r} does not match format 'dd-mmm-yyyy'") from error
+
+
+# NSE reuses the same handful of expiry strings across every symbol, so parse each one once
+_EXPIRY_DATES: Dict[str, datetime.date] = {}
+
+
+def _parse_expiry_date(date_str: str) -> datetime.date:
+    date = _EXPIRY_DATES.get(date_str)
+    if date is None:
+        date = _EXPIRY_DATES[date_str] = _parse_nse_date(date_str)
+    return date
+
+
+@lru_cache(maxsize=1024)
+def _filter_expiry_dates_cached(expiry_dates_str: tuple[str, ...], today: datetime.date) -> tuple[str, ...]:
+    """Keeps the expiry dates on or after today, keyed on today so results roll over at midnight."""
+    return tuple(
+        date.strftime("%d-%b-%Y")
+        for date in map(_parse_expiry_date, expiry_dates_str)
+        if date >= today
+    )
+
+
+@lru_cache(maxsize=1)
+def _today_str(ordinal: int) -> str:
+    """Today as "dd-mm-yyyy", formatted once per day (keyed on the date's ordinal)."""
+    return datetime.date.fromordinal(ordinal).strftime("%d-%m-%Y")
+
+
+@lru_cache(maxsize=256)
+def _past_trading_date_cached(today: datetime.date, days: int, holidays: frozenset[datetime.date]) -> str:
+    """Steps back `days` trading days from `days` calendar days before today, as "dd-mm-yyyy"."""
+    past_date = today - datetime.timedelta(days=days)
+    if days <= 0:
+        # Nothing to step back; rolling forward below would move a weekend/holiday into the future
+        return past_date.strftime("%d-%m-%Y")
+    holiday_array = np.array(sorted(holidays), dtype="datetime64[D]")
+
+    # Rolling forward first makes a weekend/holiday start count the same as the next trading day
+    past_date = np.busday_offset(past_date, -days, roll="forward", holidays=holiday_array)
+
+    return past_date.astype(datetime.date).strftime("%d-%m-%Y")
+
+
+def _black_scholes(S0, X, t, sigma, r, q, td):
+    """
+    Black-Scholes prices and Greeks on floats or NumPy arrays (t in years, sigma and q as fractions).
+    Uses scipy.special.ndtr, the ufunc behind norm.cdf, so whole arrays of strikes price in one call.
+    """
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(S0 / X) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    pdf_d1 = np.exp(-(d1 * d1) / 2) / math.sqrt(2 * math.pi)
+    cdf_d1, cdf_d2 = ndtr(d1), ndtr(d2)
+    cdf_neg_d1, cdf_neg_d2 = ndtr(-d1), ndtr(-d2)
+    dividend_discount = np.exp(-q * t)
+    rate_discount = np.exp(-r * t)
+    time_decay = (S0 * sigma * dividend_discount) / (2 * sqrt_t) * pdf_d1
+
+    call_theta = (
+        -time_decay - r * X * rate_discount * cdf_d2 + q * dividend_discount * S0 * cdf_d1
+    ) / td
+    put_theta = (
+        -time_decay + r * X * rate_discount * cdf_neg_d2 - q * dividend_discount * S0 * cdf_neg_d1
+    ) / td
+    call_premium = dividend_discount * S0 * cdf_d1 - X * rate_discount * cdf_d2
+    put_premium = X * rate_discount * cdf_neg_d2 - dividend_discount * S0 * cdf_neg_d1
+    call_delta = dividend_discount * cdf_d1
+    put_delta = dividend_discount * (cdf_d1 - 1)
+    gamma = rate_discount / (S0 * sigma * sqrt_t) * pdf_d1
+    vega = (1 / 100) * S0 * rate_discount * sqrt_t * pdf_d1
+    call_rho = (1 / 100) * X * t * rate_discount * cdf_d2
+    put_rho = (-1 / 100) * X * t * rate_discount * cdf_neg_d2
+
+    return (
+        call_theta,
+        put_theta,
+        call_premium,
+        put_premium,
+        call_delta,
+        put_delta,
+        gamma,
+        vega,
+        call_rho,
+        put_rho,
+    )
+
 
 class NSEFetcher:
     """
     Handles fetching data from NSE, abstracting away the underlying method.
     """
 
-    def __init__(self, mode: Mode = Mode.LOCAL):
+    def __init__(self, mode: Mode = Mode.LOCAL, proxy: Optional[str] = None, pool_size: int = 100):
         self.mode = mode
+        self.proxy = proxy
+        self.pool_size = pool_size
         self.HEADERS = {
             "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
             "accept-language": "en-US,en;q=0.9,en-IN;q=0.8,en-GB;q=0.7",
@@ -57,16 +280,6 @@ class NSEFetcher:
             "upgrade-insecure-requests": "1",
             "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36 Edg/129.0.0.0",
         }
-        self.CURL_HEADERS = (
-            ' -H "authority: beta.nseindia.com" -H "cache-control: max-age=0" '
-            '-H "dnt: 1" -H "upgrade-insecure-requests: 1" '
-            '-H "user-agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-            '(KHTML, like Gecko) Chrome/79.0.3945.117 Safari/537.36" '
-            '-H "sec-fetch-user: ?1" -H "accept: text/html,application/xhtml+xml,application/xml;q=0.9,'
-            'image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9" '
-            '-H "sec-fetch-site: none" -H "sec-fetch-mode: navigate" '
-            '-H "accept-encoding: gzip, deflate, br" -H "accept-language: en-US,en;q=0.9,hi;q=0.8" --compressed'
-        )
         self.NIFTY_INDICES_HEADERS = {
             "Connection": "keep-alive",
             "sec-ch-ua": '" Not;A Brand";v="99", "Google Chrome";v="91", "Chromium";v="91"',
@@ -82,21 +295,39 @@ class NSEFetcher:
             "Sec-Fetch-Dest": "empty",
             "Referer": "https://niftyindices.com/reports/historical-data",
         }
+        self.cookie_jar = None
+        self.connector = None
         self.session = None
 
     async def _init_session(self):
         """Initialize the aiohttp session"""
         if self.session is None:
-            self.session = aiohttp.ClientSession(headers=self.HEADERS)
+            if self.cookie_jar is None:
+                # CookieJar binds to the running loop, so it cannot be built in __init__
+                self.cookie_jar = aiohttp.CookieJar()
+            self.connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=min(32, self.pool_size),
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            self.session = aiohttp.ClientSession(
+                headers=self.HEADERS,
+                cookie_jar=self.cookie_jar,
+                connector=self.connector,
+                connector_owner=True,
+            )
         return self
 
     async def close(self):
-        """Close the aiohttp session"""
+        """Close the aiohttp session and its connector"""
         if self.session:
             await self.session.close()
             self.session = None
+            self.connector = None
 
     async def _fetch(self, payload: str) -> dict:
+        await self._init_session()
         try:
             if self.mode == Mode.VPN:
                 return await self._fetch_vpn(payload)
@@ -110,48 +341,73 @@ class NSEFetcher:
         try:
             async with self.session.get(payload) as response:
                 response.raise_for_status()
-                return await response.json()
+                return orjson.loads(await response.read())
         except (aiohttp.ClientError, ValueError, json.JSONDecodeError):
-            logging.info("Retrying with a new session...")
-            await self.close()
-            self.session = aiohttp.ClientSession(headers=self.HEADERS)
-            async with self.session.get("http://nseindia.com") as _:
+            # Refresh cookies only; the pooled keep-alive connections stay usable
+            logging.info("Retrying after cookie refresh...")
+            self.cookie_jar.clear()
+            async with self.session.get("https://www.nseindia.com") as _:
                 pass
             async with self.session.get(payload) as response:
                 response.raise_for_status()
-                return await response.json()
+                return orjson.loads(await response.read())
 
     async def _fetch_vpn(self, payload: str) -> dict:
-        encoded_url = (
-            urllib.parse.quote(payload, safe=":/?&=")
-            if ("%26" not in payload and "%20" not in payload)
-            else payload
-        )
-        payload_command = f'curl -b cookies.txt "{encoded_url}"{self.CURL_HEADERS}'
         try:
-            output = os.popen(payload_command).read()
-            return json.loads(output)
-        except ValueError:
+            async with self.session.get(payload, proxy=self.proxy) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except (aiohttp.ClientError, ValueError):
             logging.info("Retrying VPN fetch after cookie refresh...")
-            os.popen(f'curl -c cookies.txt "https://www.nseindia.com"{self.CURL_HEADERS}').read()
-            output = os.popen(payload_command).read()
-            return json.loads(output)
-        
-    async def _fetch_pdf(self, url: str) -> bytes:
+            async with self.session.get("https://www.nseindia.com", proxy=self.proxy) as _:
+                pass
+            async with self.session.get(payload, proxy=self.proxy) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+
+    async def _fetch_pdf(self, url: str, sink: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """
+        Downloads a PDF in 64 KiB chunks. With a sink (any writable binary file object)
+        the chunks are written straight to it and None is returned; otherwise the bytes are returned.
+        """
+        buffer = sink if sink is not None else io.BytesIO()
+        await self._init_session()
         try:
             async with self.session.get(url) as response:
                 response.raise_for_status()
-                return await response.read()
+                async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+                    buffer.write(chunk)
+            return None if sink is not None else buffer.getvalue()
         except aiohttp.ClientError as error:
             logging.error(f"Error fetching PDF: {error}")
             raise
 
+    async def _fetch_csv(self, url: str, **read_csv_kwargs) -> pd.DataFrame:
+        """
+        Downloads a CSV over the pooled session and parses it off the event loop.
+        Keyword arguments are passed on to pd.read_csv.
+        """
+        await self._init_session()
+        proxy = self.proxy if self.mode == Mode.VPN else None
+        try:
+            async with self.session.get(url, proxy=proxy) as response:
+                response.raise_for_status()
+                content = await response.read()
+        except aiohttp.ClientError as error:
+            logging.error(f"Error fetching CSV: {error}")
+            raise
+        return await asyncio.to_thread(pd.read_csv, io.BytesIO(content), engine="c", **read_csv_kwargs)
+
     async def fetch_niftyindices(self, url: str, data: dict) -> pd.DataFrame:
+        await self._init_session()
         try:
             async with self.session.post(url, headers=self.NIFTY_INDICES_HEADERS, json=data) as response:
                 response.raise_for_status()
-                json_response = await response.json()
-                return pd.DataFrame.from_records(json.loads(json_response["d"]))
+                records = orjson.loads(await response.read())["d"]
+                # Most endpoints wrap the records in a JSON string; decode it only when they do
+                if isinstance(records, str):
+                    records = orjson.loads(records)
+                return pd.DataFrame.from_records(records)
         except (aiohttp.ClientError, ValueError, json.JSONDecodeError) as error:
             logging.error(f"Error fetching data from NiftyIndices: {error}")
             raise
@@ -162,10 +418,24 @@ class NSEIndia:
     Main class for interacting with the NSE website.
     """
 
-    def __init__(self, mode: Mode = Mode.LOCAL):
-        self.fetcher = NSEFetcher(mode)
+    def __init__(self, mode: Mode = Mode.LOCAL, proxy: Optional[str] = None, pool_size: int = 100):
+        self.fetcher = NSEFetcher(mode, proxy, pool_size)
         self._fno_symbols = None
         self._eq_symbols = None
+        self._fno_symbols_set = None
+        self._eq_symbols_set = None
+        # Guard the one-off symbol list fetches so concurrent first calls share a single request
+        self._fno_lock = asyncio.Lock()
+        self._eq_lock = asyncio.Lock()
+        # Caps the date-window requests _fetch_historical_data keeps in flight against NSE
+        self._historical_semaphore = asyncio.Semaphore(HISTORICAL_CONCURRENCY)
+        self._quote_cache: Dict[str, tuple[float, dict]] = {}
+        self._indexed_payloads: Dict[str, tuple[float, Dict[str, dict]]] = {}
+        self._history_cache: Dict[str, tuple[float, datetime.date, datetime.date, pd.DataFrame]] = {}
+        self._holiday_dates: Dict[
+            tuple[HolidayType, MarketSegment],
+            tuple[datetime.date, frozenset[datetime.date], Dict[datetime.date, str]],
+        ] = {}
 
     async def __aenter__(self):
         """Async context manager enter"""
@@ -178,50 +448,78 @@ class NSEIndia:
 
     def _running_status(self) -> bool:
         """Checks if the market is currently running."""
-        now = datetime.datetime.now()
-        start = now.replace(hour=9, minute=15, second=0, microsecond=0)
-        end = now.replace(hour=15, minute=30, second=0, microsecond=0)
-        return start < now < end
+        return _MKT_OPEN < datetime.datetime.now().time() < _MKT_CLOSE
 
     def _filter_expiry_dates(self, expiry_dates_str: List[str]) -> List[str]:
         """
         Filters and sorts expiry dates to include only those on or after today.
         """
-        expiry_dates = [
-            datetime.datetime.strptime(date, "%d-%b-%Y").date()
-            for date in expiry_dates_str
-        ]
-        expiry_dates = [
-            date.strftime("%d-%b-%Y")
-            for date in expiry_dates
-            if date >= datetime.datetime.now().date()
-        ]
-        return expiry_dates
+        return list(
+            _filter_expiry_dates_cached(tuple(expiry_dates_str), datetime.date.today())
+        )
 
-    def _purify_symbol(self, symbol: str) -> str:
-        return symbol.replace("&", "%26")
+    def _expiry_keys_by_instrument(self, expiry_dates_by_instrument: dict) -> Dict[str, str]:
+        """
+        Maps "Futures" and "Options" to the first matching expiryDatesByInstrument key
+        (e.g. "Stock Futures"), lowering each key once in a single pass.
+        """
+        keys: Dict[str, str] = {}
+        for key in expiry_dates_by_instrument:
+            lowered = key.lower()
+            if "futures" in lowered:
+                keys.setdefault("Futures", key)
+            elif "options" in lowered:
+                keys.setdefault("Options", key)
+        return keys
 
     async def get_fno_symbols(self) -> List[str]:
         """Gets the list of FNO symbols."""
         if self._fno_symbols is None:
-            logging.info("Fetching FNO symbols...")
-            fno_data = await self.fetcher._fetch(
-                "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-            )
-            data = fno_data["data"]
-            self._fno_symbols = ["NIFTY", "NIFTYIT", "BANKNIFTY"] + [
-                item["symbol"] for item in data
-            ]
+            async with self._fno_lock:
+                if self._fno_symbols is None:
+                    logging.info("Fetching FNO symbols...")
+                    fno_data = await self.fetcher._fetch(
+                        "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
+                    )
+                    data = fno_data["data"]
+                    self._fno_symbols = ["NIFTY", "NIFTYIT", "BANKNIFTY"] + [
+                        item["symbol"] for item in data
+                    ]
+                    self._fno_symbols_set = frozenset(self._fno_symbols)
         return self._fno_symbols
 
-    def get_equity_symbols(self) -> List[str]:
+    async def _load_equity_list(self) -> pd.DataFrame:
+        """
+        Loads the equity list from the disk cache, downloading it again when the
+        cached copy is missing or older than EQUITY_LIST_CACHE_TTL.
+        """
+        try:
+            age = datetime.datetime.now().timestamp() - os.path.getmtime(EQUITY_LIST_CACHE_PATH)
+            if age < EQUITY_LIST_CACHE_TTL:
+                return pd.read_csv(EQUITY_LIST_CACHE_PATH, usecols=["SYMBOL"])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as error:
+            logging.info(f"Equity list cache unusable, refetching: {error}")
+
+        logging.info("Fetching Equity symbols...")
+        eq_list_pd = await self.fetcher._fetch_csv(EQUITY_LIST_URL, usecols=["SYMBOL"])
+        try:
+            os.makedirs(os.path.dirname(EQUITY_LIST_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{EQUITY_LIST_CACHE_PATH}.{os.getpid()}.tmp"
+            eq_list_pd.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, EQUITY_LIST_CACHE_PATH)
+        except OSError as error:
+            logging.error(f"Could not write equity list cache: {error}")
+        return eq_list_pd
+
+    async def get_equity_symbols(self) -> List[str]:
         """Gets the list of equity symbols."""
         if self._eq_symbols is None:
-            logging.info("Fetching Equity symbols...")            
-            eq_list_pd = pd.read_csv(
-                "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
-            )
-            self._eq_symbols = eq_list_pd["SYMBOL"].tolist()
+            async with self._eq_lock:
+                if self._eq_symbols is None:
+                    self._eq_symbols = (await self._load_equity_list())["SYMBOL"].tolist()
+                    self._eq_symbols_set = frozenset(self._eq_symbols)
         return self._eq_symbols
 
     async def is_valid_symbol(self, symbol: str, fno: bool = False) -> bool:
@@ -233,19 +531,41 @@ class NSEIndia:
         :return:
         """
         if fno:
-            return symbol.upper() in await self.get_fno_symbols()
+            await self.get_fno_symbols()
+            return symbol.upper() in self._fno_symbols_set
         else:
-            return symbol.upper() in self.get_equity_symbols()
+            await self.get_equity_symbols()
+            return symbol.upper() in self._eq_symbols_set
 
     async def get_option_chain(self, symbol: str) -> dict:
         """Gets the option chain for a given symbol."""
-        symbol = self._purify_symbol(symbol)
-        if symbol in [ind.value for ind in Index]:
-            url = f"https://www.nseindia.com/api/option-chain-indices?symbol={symbol}"
+        quoted_symbol = urllib.parse.quote(symbol, safe="")
+        if symbol in _INDEX_VALUES:
+            url = f"https://www.nseindia.com/api/option-chain-indices?symbol={quoted_symbol}"
         else:
-            url = f"https://www.nseindia.com/api/option-chain-equities?symbol={symbol}"
+            url = f"https://www.nseindia.com/api/option-chain-equities?symbol={quoted_symbol}"
         return await self.fetcher._fetch(url)
 
+    async def get_option_chains(
+        self, symbols: List[str], concurrency: int = 32
+    ) -> List[Union[dict, BaseException]]:
+        """
+        Gets the option chains for several symbols concurrently.
+
+        :param symbols: List of symbols
+        :param concurrency: Maximum number of requests in flight at once
+        :return: Option chain payloads in the order of symbols; a failed fetch yields its exception
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch_one(symbol: str) -> dict:
+            async with semaphore:
+                return await self.get_option_chain(symbol)
+
+        return await asyncio.gather(
+            *(_fetch_one(symbol) for symbol in symbols), return_exceptions=True
+        )
+
     async def build_option_chain(
         self, symbol: str, expiry: str = "latest", oi_mode: str = "full"
     ) -> tuple[pd.DataFrame, float, str]:
@@ -316,97 +636,23 @@ class NSEIndia:
         else:
             raise ValueError("Invalid oi_mode.  Must be 'full' or 'compact'.")
 
-        oi_data = pd.DataFrame(columns=columns)
-        oi_row: Dict[str, Union[int, float]] = {
-            col: 0 for col in columns if col != "Strike Price"
-        }
+        ce_fields = [(key, column) for key, column in FIELD_MAP_CE.items() if column in columns]
+        pe_fields = [(key, column) for key, column in FIELD_MAP_PE.items() if column in columns]
+        rows: List[Dict[str, Union[int, float]]] = []
 
         for item in payload["records"]["data"]:
             if item["expiryDate"] == expiry:
+                oi_row = dict.fromkeys(columns, 0)
                 oi_row["Strike Price"] = item["strikePrice"]
+                ce = item.get("CE") or {}
+                pe = item.get("PE") or {}
+                for key, column in ce_fields:
+                    oi_row[column] = ce.get(key, 0)
+                for key, column in pe_fields:
+                    oi_row[column] = pe.get(key, 0)
+                rows.append(oi_row)
 
-                for option_type in ["CE", "PE"]:
-                    try:
-                        oi_row[
-                            (
-                                f"{option_type}CALLS_OI"
-                                if option_type == "CE"
-                                else f"{option_type}PUTS_OI"
-                            )
-                        ] = item[option_type]["openInterest"]
-                        oi_row[
-                            (
-                                f"{option_type}CALLS_Chng in OI"
-                                if option_type == "CE"
-                                else f"{option_type}PUTS_Chng in OI"
-                            )
-                        ] = item[option_type]["changeinOpenInterest"]
-                        oi_row[
-                            (
-                                f"{option_type}CALLS_Volume"
-                                if option_type == "CE"
-                                else f"{option_type}PUTS_Volume"
-                            )
-                        ] = item[option_type]["totalTradedVolume"]
-                        oi_row[
-                            (
-                                f"{option_type}CALLS_IV"
-                                if option_type == "CE"
-                                else f"{option_type}PUTS_IV"
-                            )
-                        ] = item[option_type]["impliedVolatility"]
-                        oi_row[
-                            (
-                                f"{option_type}CALLS_LTP"
-                                if option_type == "CE"
-                                else f"{option_type}PUTS_LTP"
-                            )
-                        ] = item[option_type]["lastPrice"]
-                        oi_row[
-                            (
-                                f"{option_type}CALLS_Net Chng"
-                                if option_type == "CE"
-                                else f"{option_type}PUTS_Net Chng"
-                            )
-                        ] = item[option_type]["change"]
-
-                        if oi_mode == "full":
-                            oi_row[
-                                (
-                                    f"{option_type}CALLS_Bid Qty"
-                                    if option_type == "CE"
-                                    else f"{option_type}PUTS_Bid Qty"
-                                )
-                            ] = item[option_type]["bidQty"]
-                            oi_row[
-                                (
-                                    f"{option_type}CALLS_Bid Price"
-                                    if option_type == "CE"
-                                    else f"{option_type}PUTS_Bid Price"
-                                )
-                            ] = item[option_type]["bidprice"]
-                            oi_row[
-                                (
-                                    f"{option_type}CALLS_Ask Price"
-                                    if option_type == "CE"
-                                    else f"{option_type}PUTS_Ask Price"
-                                )
-                            ] = item[option_type]["askPrice"]
-                            oi_row[
-                                (
-                                    f"{option_type}CALLS_Ask Qty"
-                                    if option_type == "CE"
-                                    else f"{option_type}PUTS_Ask Qty"
-                                )
-                            ] = item[option_type]["askQty"]
-                    except KeyError:
-                        pass
-                if oi_mode == "full":
-                    oi_row["CALLS_Chart"], oi_row["PUTS_Chart"] = 0, 0
-
-                oi_data = pd.concat(
-                    [oi_data, pd.DataFrame([oi_row])], ignore_index=True
-                )
+        oi_data = pd.DataFrame(rows, columns=columns)
 
         return (
             oi_data,
@@ -422,15 +668,28 @@ class NSEIndia:
         :param section:  Optional section (e.g., for specific board lots)
         :return:
         """
-        symbol = self._purify_symbol(symbol)
+        quoted_symbol = urllib.parse.quote(symbol, safe="")
         if section == "":
-            if symbol.upper() in await self.get_fno_symbols():
-                url = f"https://www.nseindia.com/api/quote-derivative?symbol={symbol}"
+            if await self.is_valid_symbol(symbol, fno=True):
+                url = f"https://www.nseindia.com/api/quote-derivative?symbol={quoted_symbol}"
             else:
-                url = f"https://www.nseindia.com/api/quote-equity?symbol={symbol}"
+                url = f"https://www.nseindia.com/api/quote-equity?symbol={quoted_symbol}"
         else:
-            url = f"https://www.nseindia.com/api/quote-equity?symbol={symbol}§ion={section}"
-        return await self.fetcher._fetch(url)
+            url = f"https://www.nseindia.com/api/quote-equity?symbol={quoted_symbol}&section={section}"
+
+        ttl = QUOTE_CACHE_TTL if self._running_status() else QUOTE_CACHE_TTL_CLOSED
+        now = time.monotonic()
+        cached = self._quote_cache.get(url)
+        # Callers get their own copy, so mutating a quote cannot leak into later cache hits
+        if cached is not None and now - cached[0] < ttl:
+            return copy.deepcopy(cached[1])
+
+        payload = await self.fetcher._fetch(url)
+        self._quote_cache.pop(url, None)
+        if len(self._quote_cache) >= QUOTE_CACHE_SIZE:
+            del self._quote_cache[next(iter(self._quote_cache))]
+        self._quote_cache[url] = (now, payload)
+        return copy.deepcopy(payload)
 
     async def get_expiry_details(
         self, symbol: str, meta: str = "Futures", i: int = 0
@@ -445,26 +704,11 @@ class NSEIndia:
         """
         payload = await self.get_quote(symbol)
 
-        if meta == "Futures":
-            selected_key = next(
-                (
-                    key
-                    for key in payload["expiryDatesByInstrument"]
-                    if "futures" in key.lower()
-                ),
-                None,
-            )
-        elif meta == "Options":
-            selected_key = next(
-                (
-                    key
-                    for key in payload["expiryDatesByInstrument"]
-                    if "options" in key.lower()
-                ),
-                None,
-            )
-        else:
+        if meta not in ("Futures", "Options"):
             raise ValueError("Invalid instrument. Must be 'Futures' or 'Options'")
+        selected_key = self._expiry_keys_by_instrument(
+            payload["expiryDatesByInstrument"]
+        ).get(meta)
 
         expiry_dates = self._filter_expiry_dates(
             payload["expiryDatesByInstrument"][selected_key]
@@ -476,7 +720,7 @@ class NSEIndia:
         if i >= len(expiry_dates):
             raise IndexError("Provided expiry index is out of range")
 
-        current_expiry = datetime.datetime.strptime(expiry_dates[i], "%d-%b-%Y").date()
+        current_expiry = _parse_nse_date(expiry_dates[i])
         dte = (current_expiry - datetime.datetime.now().date()).days
         return current_expiry, dte
 
@@ -540,14 +784,9 @@ class NSEIndia:
         if expiry_date in ("latest", "next"):
 
             if instrument_type:
-                selected_key = next(
-                    (
-                        key
-                        for key in payload["expiryDatesByInstrument"]
-                        if instrument_type.lower() in key.lower()
-                    ),
-                    None,
-                )
+                selected_key = self._expiry_keys_by_instrument(
+                    payload["expiryDatesByInstrument"]
+                ).get(instrument_type)
                 if not selected_key:
                     raise ValueError(
                         f"No {instrument_type} expiry dates found for {symbol}"
@@ -578,7 +817,7 @@ class NSEIndia:
 
         if instrument_type:
             try:
-                datetime.datetime.strptime(expiry_date, "%d-%b-%Y")
+                _parse_nse_date(expiry_date)
             except ValueError:
                 raise ValueError("Invalid expiry date format.  Should be dd-mmm-yyyy.")
 
@@ -612,7 +851,7 @@ class NSEIndia:
         self,
         symbol: str,
         expiry_date: str,
-        option_type: OptionType,
+        option_type: Union[OptionType, OptionTypeValue],
         strike_price: float,
     ) -> dict:
         """
@@ -620,7 +859,7 @@ class NSEIndia:
 
         :param symbol: The stock symbol.
         :param expiry_date: "latest", "next", or specific date "dd-mmm-yyyy".
-        :param option_type: OptionType enum value
+        :param option_type: OptionType enum value or its literal ("CE", "PE", "Fut")
         :param strike_price: Required for option_type
         :return: The metadata dictionary.
         """
@@ -628,11 +867,11 @@ class NSEIndia:
         payload = await self.get_quote(symbol)
 
         instrument_type = (
-            "Options" if option_type.value.upper() in ("PE", "CE") else "Futures"
+            "Options" if option_type.upper() in ("PE", "CE") else "Futures"
         )
 
         # Special case for indices and futures: use RELIANCE expiry dates as a proxy. Bit of a hack.
-        if symbol in [ind.value for ind in Index] and option_type.upper() == "FUT":
+        if symbol in _INDEX_VALUES and option_type.upper() == "FUT":
             expiry_dates = await self.get_expiry_list("RELIANCE")
             if expiry_date == "latest":
                 expiry_date = expiry_dates[0]
@@ -640,14 +879,9 @@ class NSEIndia:
                 expiry_date = expiry_dates[1]
 
         if expiry_date in ("latest", "next"):
-            selected_key = next(
-                (
-                    key
-                    for key in payload["expiryDatesByInstrument"]
-                    if instrument_type.lower() in key.lower()
-                ),
-                None,
-            )
+            selected_key = self._expiry_keys_by_instrument(
+                payload["expiryDatesByInstrument"]
+            ).get(instrument_type)
             if not selected_key:
                 raise ValueError(
                     f"No {instrument_type} expiry dates found for {symbol}"
@@ -671,14 +905,14 @@ class NSEIndia:
                 )
 
         try:
-            datetime.datetime.strptime(expiry_date, "%d-%b-%Y")
+            _parse_nse_date(expiry_date)
         except ValueError:
             raise ValueError("Invalid expiry date format. Should be dd-mmm-yyyy.")
 
         _option_type = (
             "Put"
-            if option_type.value.upper() == "PE"
-            else "Call" if option_type.value.upper() == "CE" else "Futures"
+            if option_type.upper() == "PE"
+            else "Call" if option_type.upper() == "CE" else "Futures"
         )
 
         for stock_data in payload["stocks"]:
@@ -739,6 +973,18 @@ class NSEIndia:
             f"Option chain data not found for strike {strike_price}, expiry {expiry_date}, option type {option_type}"
         )
 
+    async def _fetch_with_fallback(self, url: str, fallback_url: str) -> dict:
+        """
+        Fetches url and returns its payload unless NSE answered it with an empty "error"
+        object, in which case fallback_url is fetched and returned instead. The fallback is
+        only requested when it is needed, so a good first payload costs a single request.
+        """
+        payload = await self.fetcher._fetch(url)
+        if "error" in payload and payload["error"] == {}:
+            logging.warning(f"{url} returned an error, using {fallback_url}.")
+            return await self.fetcher._fetch(fallback_url)
+        return payload
+
     async def get_equity_info(self, symbol: str) -> dict:
         """
         Fetches equity information, automatically handling potential F&O symbols.
@@ -746,17 +992,12 @@ class NSEIndia:
         :param symbol: The stock symbol.
         :return: The equity information dictionary.
         """
-        symbol = self._purify_symbol(symbol)
+        quoted_symbol = urllib.parse.quote(symbol, safe="")
         try:
-            payload = await self.fetcher._fetch(
-                f"https://www.nseindia.com/api/quote-equity?symbol={symbol}"
+            payload = await self._fetch_with_fallback(
+                f"https://www.nseindia.com/api/quote-equity?symbol={quoted_symbol}",
+                f"https://www.nseindia.com/api/quote-derivative?symbol={quoted_symbol}",
             )
-            # Check for error, and if present, try the derivative endpoint.
-            if "error" in payload and payload["error"] == {}:
-                logging.warning("Equity endpoint failed, trying F&O endpoint.")
-                payload = await self.fetcher._fetch(
-                    f"https://www.nseindia.com/api/quote-derivative?symbol={symbol}"
-                )
         except KeyError:
             logging.error("Error fetching data. Check symbol and API status.")
             raise
@@ -773,26 +1014,23 @@ class NSEIndia:
         if not await self.is_valid_symbol(symbol):
             raise ValueError(f"Invalid Symbol {symbol} provided")
 
-        symbol = self._purify_symbol(symbol)
+        quoted_symbol = urllib.parse.quote(symbol, safe="")
         try:
-            payload = await self.fetcher._fetch(
-                f"https://www.nseindia.com/api/quote-derivative?symbol={symbol}"
+            payload = await self._fetch_with_fallback(
+                f"https://www.nseindia.com/api/quote-derivative?symbol={quoted_symbol}",
+                f"https://www.nseindia.com/api/quote-equity?symbol={quoted_symbol}",
             )
-            # Check for error, and if present, try the equity endpoint.
-            if "error" in payload and payload["error"] == {}:
-                logging.warning("Derivative endpoint failed, trying equity endpoint.")
-                payload = await self.fetcher._fetch(
-                    f"https://www.nseindia.com/api/quote-equity?symbol={symbol}"
-                )
         except KeyError:
             logging.error("Error fetching data. Check symbol and API status.")
             raise
         return payload
 
-    async def get_holidays(self, holiday_type: HolidayType = HolidayType.TRADING) -> dict:
+    async def get_holidays(
+        self, holiday_type: Union[HolidayType, HolidayTypeValue] = HolidayType.TRADING
+    ) -> dict:
         """Gets the trading or clearing holidays."""
         return await self.fetcher._fetch(
-            f"https://www.nseindia.com/api/holiday-master?type={holiday_type.value}"
+            f"https://www.nseindia.com/api/holiday-master?type={holiday_type}"
         )
 
     async def get_corporate_results(
@@ -807,12 +1045,12 @@ class NSEIndia:
         """
         if index not in ["equities", "debt", "sme"]:
             raise ValueError("Invalid index. Must be 'equities', 'debt', or 'sme'.")
-        if period.value not in [rp.value for rp in ResultPeriod]:
+        if period not in _RESULT_PERIODS:
             raise ValueError(
                 "Invalid period. Must be 'Quarterly', 'Annual', 'Half-Yearly' or 'Others'."
             )
 
-        url = f"https://www.nseindia.com/api/corporates-financial-results?index={index}&period={period.value}"
+        url = f"https://www.nseindia.com/api/corporates-financial-results?index={index}&period={period}"
         return pd.json_normalize(await self.fetcher._fetch(url))
 
     async def get_events(self) -> pd.DataFrame:
@@ -823,9 +1061,9 @@ class NSEIndia:
 
     async def get_past_results(self, symbol: str) -> dict:
         """Gets past corporate results for a symbol."""
-        symbol = self._purify_symbol(symbol)
+        quoted_symbol = urllib.parse.quote(symbol, safe="")
         return await self.fetcher._fetch(
-            f"https://www.nseindia.com/api/results-comparision?symbol={symbol}"
+            f"https://www.nseindia.com/api/results-comparision?symbol={quoted_symbol}"
         )
 
     async def get_expiry_list(
@@ -845,15 +1083,37 @@ class NSEIndia:
 
         if type == "list":
             payload = await self.get_quote(symbol)
-            expiry_dates = sorted(
-                list(set(payload["expiryDates"])),
-                key=lambda date: datetime.datetime.strptime(date, "%d-%b-%Y"),
-            )
+            expiry_dates = sorted(set(payload["expiryDates"]), key=_parse_expiry_date)
             return expiry_dates
         else:
             payload = await self.get_option_chain(symbol)
             return pd.DataFrame({"Date": payload["records"]["expiryDates"]})
 
+    async def _indexed_payload(self, url: str, key: str) -> Dict[str, dict]:
+        """
+        Fetches a payload whose "data" is a list of rows and indexes the rows by row[key].
+        The index is reused for INDEXED_PAYLOAD_TTL seconds, so back-to-back lookups share one request.
+        """
+        now = time.monotonic()
+        cached = self._indexed_payloads.get(url)
+        if cached is None or now - cached[0] >= INDEXED_PAYLOAD_TTL:
+            payload = await self.fetcher._fetch(url)
+            cached = self._indexed_payloads[url] = (
+                now,
+                {item[key]: item for item in payload["data"]},
+            )
+        return cached[1]
+
+    async def _fno_index(self) -> Dict[str, dict]:
+        """F&O securities keyed by symbol."""
+        return await self._indexed_payload(
+            "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O", "symbol"
+        )
+
+    async def _all_indices_map(self) -> Dict[str, dict]:
+        """All NSE indices keyed by index name."""
+        return await self._indexed_payload("https://www.nseindia.com/api/allIndices", "index")
+
     async def get_custom_fno_data(self, symbol: str, attribute: str = "lastPrice") -> any:
         """
         Gets custom data from the F&O securities list.
@@ -865,13 +1125,10 @@ class NSEIndia:
         if not await self.is_valid_symbol(symbol):
             raise ValueError(f"Invalid Symbol {symbol} provided")
 
-        positions = await self.fetcher._fetch(
-            "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-        )
-        for item in positions["data"]:
-            if item["symbol"] == symbol.upper():
-                return item[attribute]
-        raise ValueError(f"Symbol {symbol} not found in F&O list.")
+        try:
+            return (await self._fno_index())[symbol.upper()][attribute]
+        except KeyError:
+            raise ValueError(f"Symbol {symbol} not found in F&O list.")
 
     async def get_block_deals(self) -> dict:
         """Gets the block deals data."""
@@ -891,12 +1148,14 @@ class NSEIndia:
 
     async def get_fii_dii_data(self, mode: str = "pandas") -> Union[pd.DataFrame, dict]:
         """Gets FII/DII trading activity data."""
+        data = await self.fetcher._fetch("https://www.nseindia.com/api/fiidiiTradeReact")
+        if mode != "pandas":
+            return data
         try:
-            data = await self.fetcher._fetch("https://www.nseindia.com/api/fiidiiTradeReact")
-            return pd.DataFrame(data) if mode == "pandas" else data
-        except:
-            logging.info("Pandas is not working for some reason.")
-            return await self.fetcher._fetch("https://www.nseindia.com/api/fiidiiTradeReact")
+            return pd.DataFrame(data)
+        except (KeyError, ValueError, TypeError) as error:
+            logging.warning(f"Could not build a DataFrame, returning raw data: {error}")
+            return data
 
     async def get_nsetools_quote(self, symbol: str) -> dict:
         """
@@ -910,21 +1169,14 @@ class NSEIndia:
         if not await self.is_valid_symbol(symbol):
             raise ValueError(f"Invalid Symbol {symbol} provided")
 
-        payload = await self.fetcher._fetch(
-            "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-        )
-        for item in payload["data"]:
-            if item["symbol"] == symbol.upper():
-                return item
-        raise ValueError(f"Symbol {symbol} not found")
+        try:
+            return (await self._fno_index())[symbol.upper()]
+        except KeyError:
+            raise ValueError(f"Symbol {symbol} not found")
 
-    @cache
     async def get_index_list(self) -> List[str]:
         """Gets the list of indices."""
-        payload = await self.fetcher._fetch(
-            "https://www.nseindia.com/api/allIndices"
-        )
-        return [item["index"] for item in payload["data"]]
+        return list(await self._all_indices_map())
 
     async def get_index_quote(self, index: str) -> dict:
         """
@@ -933,42 +1185,42 @@ class NSEIndia:
         :param index:
         :return:
         """
-        payload = await self.fetcher._fetch(
-            "https://www.nseindia.com/api/allIndices"
-        )
-        for item in payload["data"]:
-            if item["index"] == index.upper():
-                return item
-        raise ValueError(f"Index {index} not found.")
+        try:
+            return (await self._all_indices_map())[index.upper()]
+        except KeyError:
+            raise ValueError(f"Index {index} not found.")
 
     async def get_advances_declines(self, mode: str = "pandas") -> Union[pd.DataFrame, dict]:
         """Gets advances and declines data."""
+        data = await self.fetcher._fetch(
+            "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
+        )
+        if mode != "pandas":
+            return data
         try:
-            data = await self.fetcher._fetch(
-                "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-            )
-            return pd.DataFrame(data["data"]) if mode == "pandas" else data
-        except:
-            logging.info("Pandas is not working for some reason.")
-            return await self.fetcher._fetch(
-                "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-            )
+            return pd.DataFrame(data["data"])
+        except (KeyError, ValueError, TypeError) as error:
+            logging.warning(f"Could not build a DataFrame, returning raw data: {error}")
+            return data
+
+    async def get_movers(self, count: int = 5) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Gets the top gainers and losers among F&O securities from a single fetch.
+
+        :param count: Number of rows in each table
+        :return: (gainers, losers)
+        """
+        df = pd.DataFrame(list((await self._fno_index()).values()))
+        df["pChange"] = pd.to_numeric(df["pChange"], errors="coerce")
+        return df.nlargest(count, "pChange"), df.nsmallest(count, "pChange")
 
     async def get_top_losers(self) -> pd.DataFrame:
         """Gets the top 5 losers."""
-        positions = await self.fetcher._fetch(
-            "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-        )
-        df = pd.DataFrame(positions["data"])
-        return df.sort_values(by="pChange").head(5)
+        return (await self.get_movers())[1]
 
     async def get_top_gainers(self) -> pd.DataFrame:
         """Gets the top 5 gainers."""
-        positions = await self.fetcher._fetch(
-            "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
-        )
-        df = pd.DataFrame(positions["data"])
-        return df.sort_values(by="pChange", ascending=False).head(5)
+        return (await self.get_movers())[0]
 
     # def get_fno_lot_sizes(
     #     self, symbol: str = "all", mode: str = "list"
@@ -1014,19 +1266,17 @@ class NSEIndia:
 
     async def get_india_vix(self) -> float:
         """Returns the current value of India VIX."""
-        payload = await self.fetcher._fetch("https://www.nseindia.com/api/allIndices")
-        for index_data in payload["data"]:
-            if index_data["index"] == "INDIA VIX":
-                return index_data["last"]
-        raise ValueError("INDIA VIX not found in the response.")
+        try:
+            return (await self._all_indices_map())["INDIA VIX"]["last"]
+        except KeyError:
+            raise ValueError("INDIA VIX not found in the response.")
 
     async def get_index_info(self, index: str) -> dict:
         """Returns information about a given index."""
-        payload = await self.fetcher._fetch("https://www.nseindia.com/api/allIndices")
-        for index_data in payload["data"]:
-            if index_data["index"] == index:
-                return index_data
-        raise ValueError(f"Index '{index}' not found in the response.")
+        try:
+            return (await self._all_indices_map())[index]
+        except KeyError:
+            raise ValueError(f"Index '{index}' not found in the response.")
 
     async def calculate_black_scholes(
         self,
@@ -1063,134 +1313,147 @@ class NSEIndia:
             float(t / td),
         )
 
-        d1 = (math.log(S0 / X) + (r - q + 0.5 * sigma**2) * t) / (sigma * math.sqrt(t))
-        Nd1 = (math.exp((-(d1**2)) / 2)) / math.sqrt(2 * math.pi)
-        d2 = d1 - sigma * math.sqrt(t)
-        Nd2 = norm.cdf(d2)
-
-        call_theta = (
-            -(
-                (S0 * sigma * math.exp(-q * t))
-                / (2 * math.sqrt(t))
-                * (1 / (math.sqrt(2 * math.pi)))
-                * math.exp(-(d1 * d1) / 2)
-            )
-            - (r * X * math.exp(-r * t) * norm.cdf(d2))
-            + (q * math.exp(-q * t) * S0 * norm.cdf(d1))
-        ) / td
-        put_theta = (
-            -(
-                (S0 * sigma * math.exp(-q * t))
-                / (2 * math.sqrt(t))
-                * (1 / (math.sqrt(2 * math.pi)))
-                * math.exp(-(d1 * d1) / 2)
-            )
-            + (r * X * math.exp(-r * t) * norm.cdf(-d2))
-            - (q * math.exp(-q * t) * S0 * norm.cdf(-d1))
-        ) / td
-        call_premium = math.exp(-q * t) * S0 * norm.cdf(d1) - X * math.exp(
-            -r * t
-        ) * norm.cdf(d1 - sigma * math.sqrt(t))
-        put_premium = X * math.exp(-r * t) * norm.cdf(-d2) - math.exp(
-            -q * t
-        ) * S0 * norm.cdf(-d1)
-        call_delta = math.exp(-q * t) * norm.cdf(d1)
-        put_delta = math.exp(-q * t) * (norm.cdf(d1) - 1)
-        gamma = (
-            (math.exp(-r * t) / (S0 * sigma * math.sqrt(t)))
-            * (1 / (math.sqrt(2 * math.pi)))
-            * math.exp(-(d1 * d1) / 2)
-        )
-        vega = ((1 / 100) * S0 * math.exp(-r * t) * math.sqrt(t)) * (
-            1 / (math.sqrt(2 * math.pi)) * math.exp(-(d1 * d1) / 2)
-        )
-        call_rho = (1 / 100) * X * t * math.exp(-r * t) * norm.cdf(d2)
-        put_rho = (-1 / 100) * X * t * math.exp(-r * t) * norm.cdf(-d2)
+        return tuple(float(value) for value in _black_scholes(S0, X, t, sigma, r, q, td))
 
-        return (
-            call_theta,
-            put_theta,
-            call_premium,
-            put_premium,
-            call_delta,
-            put_delta,
-            gamma,
-            vega,
-            call_rho,
-            put_rho,
+    async def calculate_black_scholes_batch(
+        self,
+        S0: float,
+        X: Union[List[float], np.ndarray],
+        t: float,
+        sigma: Union[float, List[float], np.ndarray] = None,
+        r: float = 0.10,
+        q: float = 0.0,
+        td: int = 365,
+    ) -> tuple[np.ndarray, ...]:
+        """
+        Calculates option prices and Greeks for a whole set of strikes in one vectorised pass.
+
+        :param S0: Current price of the underlying asset.
+        :param X: Strike prices of the options.
+        :param t: Time to expiration in days.
+        :param sigma: Volatility (a scalar or one per strike). If None, uses India VIX.
+        :param r: Risk-free interest rate (annualized). Default is 10% pa.
+        :param q: Continuous dividend yield (annualized).
+        :param td: Number of trading days in a year.
+        :return: Same tuple as calculate_black_scholes, with one array element per strike.
+        """
+
+        if sigma is None:
+            sigma = await self.get_india_vix()
+
+        return _black_scholes(
+            float(S0),
+            np.asarray(X, dtype=np.float64),
+            float(t / td),
+            np.asarray(sigma, dtype=np.float64) / 100,
+            float(r),
+            float(q / 100),
+            td,
         )
 
-    async def _fetch_historical_data(self, url: str, chunk_size: int = 40) -> pd.DataFrame:
+    async def _fetch_historical_data(
+        self,
+        url_template: str,
+        start_date_str: str,
+        end_date_str: str,
+        chunk_size: int = 40,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> tuple[pd.DataFrame, bool]:
         """
         Helper function to fetch historical data with pagination.
         Handles fetching large datasets by breaking them into smaller chunks.
+
+        :param url_template: URL with {start_date} and {end_date} placeholders for each chunk
+        :param start_date_str: "dd-mm-yyyy"
+        :param end_date_str: "dd-mm-yyyy"
+        :param chunk_size: Number of days fetched per request
+        :param dtypes: Column dtypes applied to each chunk (columns missing from a chunk are skipped)
+        :return: (data, whether every chunk was fetched); failed chunks are logged and left out
         """
-        start_date_str, end_date_str = self._extract_start_end_dates(url)
         start_date = datetime.datetime.strptime(start_date_str, "%d-%m-%Y")
         end_date = datetime.datetime.strptime(end_date_str, "%d-%m-%Y")
 
-        all_data = pd.DataFrame()
+        windows = []
         current_start = start_date
-
         while current_start <= end_date:
             current_end = min(
                 current_start + datetime.timedelta(days=chunk_size - 1), end_date
             )
-            current_start_str = current_start.strftime("%d-%m-%Y")
-            current_end_str = current_end.strftime("%d-%m-%Y")
-
-            chunk_url = url.replace(start_date_str, current_start_str).replace(
-                end_date_str, current_end_str
+            windows.append(
+                (current_start.strftime("%d-%m-%Y"), current_end.strftime("%d-%m-%Y"))
             )
-            logging.info(f"Fetching data from {current_start_str} to {current_end_str}")
+            current_start = current_end + datetime.timedelta(days=1)
 
-            try:
+        async def _fetch_chunk(current_start_str: str, current_end_str: str) -> pd.DataFrame:
+            chunk_url = url_template.format(start_date=current_start_str, end_date=current_end_str)
+            async with self._historical_semaphore:
+                logging.info(f"Fetching data from {current_start_str} to {current_end_str}")
                 chunk_data = await self.fetcher._fetch(chunk_url)
-                if "data" not in chunk_data:
-                    raise ValueError(
-                        f"API returned no data or unexpected format. Response: {chunk_data}"
-                    )
+            if "data" not in chunk_data:
+                raise ValueError(
+                    f"API returned no data or unexpected format. Response: {chunk_data}"
+                )
+            df_chunk = pd.DataFrame.from_records(chunk_data["data"])
+            if dtypes:
+                df_chunk = df_chunk.astype(
+                    {column: dtype for column, dtype in dtypes.items() if column in df_chunk.columns}
+                )
+            return df_chunk
 
-                df_chunk = pd.DataFrame.from_records(chunk_data["data"])
-                all_data = pd.concat([all_data, df_chunk], ignore_index=True)
-            except Exception as e:
-                logging.error(f"Failed to fetch historical data chunk: {e}")
+        chunks = await asyncio.gather(
+            *(_fetch_chunk(*window) for window in windows), return_exceptions=True
+        )
 
-            current_start = current_end + datetime.timedelta(days=1)
+        frames = []
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                logging.error(f"Failed to fetch historical data chunk: {chunk}")
+            elif isinstance(chunk, BaseException):
+                raise chunk
+            else:
+                frames.append(chunk)
+        # Each chunk comes back newest-first, so stack them newest window first and reverse
+        # once to get the whole range in chronological order
+        all_data = pd.concat(frames[::-1], ignore_index=True) if frames else pd.DataFrame()
 
-        return all_data.iloc[::-1].reset_index(drop=True)  # Reverse and reset index
+        return all_data[::-1].reset_index(drop=True), len(frames) == len(chunks)
 
-    def _extract_start_end_dates(self, url: str) -> tuple[str, str]:
-        """Extracts start and end dates from the URL."""
-        from_date_param = urllib.parse.unquote(url).split("from=")[1].split("&")[0]
-        to_date_param = urllib.parse.unquote(url).split("to=")[1].split("&")[0]
-        return from_date_param, to_date_param
-    
     def _format_date(self, date: str, format: str = "%d-%b-%Y") -> str:
         """Formats the date to the specified format."""
         return datetime.datetime.strptime(date, "%d-%m-%Y").strftime(format)
 
-    async def _get_past_trading_date(self, days: int) -> str:
+    async def _cached_holidays(
+        self, holiday_type: HolidayType = HolidayType.TRADING, segment: MarketSegment = MarketSegment.FO
+    ) -> tuple[frozenset[datetime.date], Dict[datetime.date, str]]:
         """
-        Calculates a past trading date, considering weekends and holidays.
+        Gets the parsed holiday dates of a segment and their descriptions, cached for the rest of the day.
         """
-        end_date = datetime.datetime.now()
-        past_date = end_date - datetime.timedelta(days=days)
-
-        trading_holidays = await self.get_holidays(HolidayType.TRADING)
-        holidays = trading_holidays['FO']
-        holiday_dates = [datetime.datetime.strptime(h['tradingDate'], '%d-%b-%Y').date() for h in holidays]
+        key = (holiday_type, segment)
+        today = datetime.date.today()
+        cached = self._holiday_dates.get(key)
+        if cached is None or cached[0] != today:
+            holidays = (await self.get_holidays(holiday_type))[segment]
+            descriptions = {_parse_nse_date(h["tradingDate"]): h["description"] for h in holidays}
+            cached = self._holiday_dates[key] = (today, frozenset(descriptions), descriptions)
+        return cached[1], cached[2]
 
-        while days > 0:
-            past_date -= datetime.timedelta(days=1)
-            if past_date.weekday() >= 5 or past_date.date() in holiday_dates:
-                continue
-            days -= 1
+    async def _cached_holiday_dates(
+        self, holiday_type: HolidayType = HolidayType.TRADING, segment: MarketSegment = MarketSegment.FO
+    ) -> frozenset[datetime.date]:
+        """
+        Gets the parsed holiday dates of a segment, cached for the rest of the day.
+        """
+        return (await self._cached_holidays(holiday_type, segment))[0]
 
-        return past_date.strftime("%d-%m-%Y")
+    async def _get_past_trading_date(self, days: int) -> str:
+        """
+        Calculates a past trading date, considering weekends and holidays.
+        """
+        holiday_dates = await self._cached_holiday_dates(HolidayType.TRADING)
+        return _past_trading_date_cached(datetime.date.today(), days, holiday_dates)
 
     async def get_equity_history(
-        self, symbol: str, start_date: str, end_date: str
+        self, symbol: str, start_date: str, end_date: str, float32_prices: bool = False
     ) -> pd.DataFrame:
         """
         Gets historical equity data.
@@ -1198,13 +1461,41 @@ class NSEIndia:
         :param symbol: The stock symbol.
         :param start_date: "dd-mm-yyyy"
         :param end_date: "dd-mm-yyyy"
+        :param float32_prices: Store the close/high/low price columns as float32, halving their
+            memory for large batches of histories. Default is False (float64).
         :return:
         """
         if not await self.is_valid_symbol(symbol):
             raise ValueError(f"Invalid Symbol {symbol} provided")
 
-        url = f'https://www.nseindia.com/api/historical/cm/equity?symbol={symbol}&series=["EQ"]&from={start_date}&to={end_date}'
-        return await self._fetch_historical_data(url)
+        start = datetime.datetime.strptime(start_date, "%d-%m-%Y").date()
+        end = datetime.datetime.strptime(end_date, "%d-%m-%Y").date()
+        now = time.monotonic()
+        cached = self._history_cache.get(symbol.upper())
+        fresh = cached is not None and now - cached[0] < HISTORY_CACHE_TTL
+
+        # A range inside the one fetched last is sliced from memory instead of re-fetched
+        if fresh and cached[1] <= start and end <= cached[2]:
+            data = cached[3]
+            timestamps = data["CH_TIMESTAMP"]
+            in_range = (timestamps >= start.isoformat()) & (timestamps <= end.isoformat())
+            data = data[in_range].reset_index(drop=True)
+        else:
+            url_template = (
+                f'https://www.nseindia.com/api/historical/cm/equity?symbol={symbol}&series=["EQ"]'
+                "&from={start_date}&to={end_date}"
+            )
+            data, complete = await self._fetch_historical_data(
+                url_template, start_date, end_date, dtypes=_EQ_HIST_DTYPES
+            )
+            # A range with a failed window is returned but not cached, so later calls refetch it
+            if complete and "CH_TIMESTAMP" in data.columns and (not fresh or (start <= cached[1] and cached[2] <= end)):
+                self._history_cache[symbol.upper()] = (now, start, end, data)
+                data = data.copy()
+
+        if float32_prices:
+            data = data.astype({column: np.float32 for column in _PRICE_COLUMNS if column in data.columns})
+        return data
 
     async def get_derivative_history(
         self,
@@ -1214,7 +1505,7 @@ class NSEIndia:
         instrument_type: InstrumentType,
         expiry_date: str,
         strike_price: float = None,
-        option_type: OptionType = None,
+        option_type: Union[OptionType, OptionTypeValue] = None,
     ) -> pd.DataFrame:
         """
         Gets historical derivative data.
@@ -1232,7 +1523,7 @@ class NSEIndia:
         if not await self.is_valid_symbol(symbol):
             raise ValueError(f"Invalid Symbol {symbol} provided")
 
-        instrument_str = instrument_type.value
+        instrument_str = instrument_type
         if "NIFTY" in symbol:
             instrument_str = instrument_str.replace("STK", "IDX")
 
@@ -1249,13 +1540,14 @@ class NSEIndia:
 
         option_type_str = ""
         if option_type is not None:
-            option_type_str = f"&optionType={option_type.value}"
+            option_type_str = f"&optionType={option_type}"
 
-        url = (
-            f"https://www.nseindia.com/api/historical/fo/derivatives?&from={start_date}&to={end_date}"
+        url_template = (
+            "https://www.nseindia.com/api/historical/fo/derivatives?&from={start_date}&to={end_date}"
             f"{option_type_str}{strike_price_str}&expiryDate={expiry_date}&instrumentType={instrument_str}&symbol={symbol}"
         )
-        return await self._fetch_historical_data(url)
+        data, _ = await self._fetch_historical_data(url_template, start_date, end_date)
+        return data
 
     async def get_expiry_history(
         self,
@@ -1283,33 +1575,33 @@ class NSEIndia:
         payload = await self.fetcher._fetch(url)
 
         try:
-            datetime.datetime.strptime(start_date, "%d-%m-%Y")
-            datetime.datetime.strptime(end_date, "%d-%m-%Y")
+            start_date_obj = datetime.datetime.strptime(start_date, "%d-%m-%Y").date()
+            end_date_obj = datetime.datetime.strptime(end_date, "%d-%m-%Y").date()
         except ValueError:
             raise ValueError("Invalid date format.  Should be dd-mm-yyyy.")
 
-        for key, _ in payload["expiryDatesByInstrument"].items():
-            if instrument_type.lower() == "options" and "OPT" in key:
-                payload_data = payload["expiryDatesByInstrument"][key]
-                break
-            elif instrument_type.lower() == "futures" and "FUT" in key:
-                payload_data = payload["expiryDatesByInstrument"][key]
-                break
-        else:  # No break, meaning no matching key was found
+        expiry_dates_by_instrument = payload["expiryDatesByInstrument"]
+        prefix = "OPT" if instrument_type.lower() == "options" else "FUT"
+        # Keys are OPTSTK/OPTIDX/FUTSTK/FUTIDX; try the expected one before scanning
+        payload_data = expiry_dates_by_instrument.get(
+            f"{prefix}{'IDX' if 'NIFTY' in symbol.upper() else 'STK'}"
+        )
+        if payload_data is None:
+            payload_data = next(
+                (dates for key, dates in expiry_dates_by_instrument.items() if prefix in key), None
+            )
+        if payload_data is None:
             raise ValueError(
                 f"No {instrument_type} expiry dates found in API response for {symbol}"
             )
 
-        start_date_obj = datetime.datetime.strptime(start_date, "%d-%m-%Y").date()
-        end_date_obj = datetime.datetime.strptime(end_date, "%d-%m-%Y").date()
-
         filtered_dates = []
         added_after_end_date = (
             False  # Flag to track if one date after end_date is added
         )
 
         for date_str in payload_data:
-            date_obj = datetime.datetime.strptime(date_str, "%d-%b-%Y").date()
+            date_obj = _parse_expiry_date(date_str)
             if start_date_obj <= date_obj <= end_date_obj:
                 filtered_dates.append(date_str)
             elif date_obj > end_date_obj and not added_after_end_date:
@@ -1363,7 +1655,7 @@ class NSEIndia:
             "https://niftyindices.com/Backpage.aspx/getTotalReturnIndexString", data
         )
 
-    def get_bhavcopy(self, date: str) -> pd.DataFrame:
+    async def get_bhavcopy(self, date: str) -> pd.DataFrame:
         """
         Downloads and reads the Bhavcopy CSV file for a given date.
 
@@ -1373,12 +1665,12 @@ class NSEIndia:
         try:
             date_formatted = date.replace("-", "")
             url = f"https://archives.nseindia.com/products/content/sec_bhavdata_full_{date_formatted}.csv"
-            return pd.read_csv(url)
+            return await self.fetcher._fetch_csv(url, dtype=_BHAV_DTYPES)
         except Exception as e:
             logging.error(f"Error downloading or reading Bhavcopy for {date}: {e}")
             raise
 
-    def get_bulk_deals_data(self) -> pd.DataFrame:
+    async def get_bulk_deals_data(self) -> pd.DataFrame:
         """
         Downloads and reads the bulk deals data
 
@@ -1386,12 +1678,12 @@ class NSEIndia:
         """
         try:
             url = "https://archives.nseindia.com/content/equities/bulk.csv"
-            return pd.read_csv(url)
+            return await self.fetcher._fetch_csv(url)
         except Exception as e:
             logging.error(f"Error downloading or reading bulk deals data: {e}")
             raise
 
-    def get_block_deals_data(self) -> pd.DataFrame:
+    async def get_block_deals_data(self) -> pd.DataFrame:
         """
         Downloads and reads the block deals data.
 
@@ -1399,7 +1691,7 @@ class NSEIndia:
         """
         try:
             url = "https://archives.nseindia.com/content/equities/block.csv"
-            return pd.read_csv(url)
+            return await self.fetcher._fetch_csv(url)
         except Exception as e:
             logging.error(f"Error downloading or reading block deals data: {e}")
             raise
@@ -1464,16 +1756,15 @@ class NSEIndia:
                     how="inner",
                     suffixes=("_x", "_y"),
                 )
-            x = merged_df["daily_change_x"].tolist()
-            y = merged_df["daily_change_y"].tolist()
+            x = merged_df["daily_change_x"].to_numpy(dtype=np.float64)
+            y = merged_df["daily_change_y"].to_numpy(dtype=np.float64)
         else:
-            x = df1["daily_change"].tolist()
-            y = df2["daily_change"].tolist()
+            x = df1["daily_change"].to_numpy(dtype=np.float64)
+            y = df2["daily_change"].to_numpy(dtype=np.float64)
 
-        mean_x = sum(x) / len(x)
-        mean_y = sum(y) / len(y)
-        covariance = sum((a - mean_x) * (b - mean_y) for (a, b) in zip(x, y)) / len(x)
-        variance = sum((i - mean_y) ** 2 for i in y) / len(y)
+        deviation_y = y - y.mean()
+        covariance = np.mean((x - x.mean()) * deviation_y)
+        variance = np.mean(deviation_y * deviation_y)
 
         if variance == 0:
             return float(
@@ -1481,7 +1772,7 @@ class NSEIndia:
             )  # Return infinity if variance is zero to avoid division by zero.
 
         beta = covariance / variance
-        return round(beta, 3)
+        return round(float(beta), 3)
 
     async def get_preopen_data(
         self, key: PreopenKey = PreopenKey.NIFTY, data_type: str = "pandas"
@@ -1494,11 +1785,10 @@ class NSEIndia:
         :return: DataFrame or dictionary with pre-open data.
         """
         payload = await self.fetcher._fetch(
-            f"https://www.nseindia.com/api/market-data-pre-open?key={key.value}"
+            f"https://www.nseindia.com/api/market-data-pre-open?key={key}"
         )
         if data_type == "pandas":
-            df = pd.DataFrame(payload["data"])
-            return pd.json_normalize(df["metadata"])
+            return pd.json_normalize([row["metadata"] for row in payload["data"]])
         elif data_type == "dict":
             return payload
         else:
@@ -1533,12 +1823,14 @@ class NSEIndia:
             raise ValueError("Type must be 'securities', 'etf' or 'sme'")
 
         data = await self.fetcher._fetch(
-            f"https://www.nseindia.com/api/live-analysis-most-active-{asset_type}?index={sort_by.value}"
+            f"https://www.nseindia.com/api/live-analysis-most-active-{asset_type}?index={sort_by}"
         )
         return pd.DataFrame(data["data"])
 
     async def get_price_band_hitters(
-        self, band_type: BandType = BandType.BOTH, view: BandView = BandView.ALL
+        self,
+        band_type: Union[BandType, BandTypeValue] = BandType.BOTH,
+        view: BandView = BandView.ALL,
     ) -> pd.DataFrame:
         """
         Retrieves data on securities hitting price bands.
@@ -1550,7 +1842,7 @@ class NSEIndia:
         payload = await self.fetcher._fetch(
             "https://www.nseindia.com/api/live-analysis-price-band-hitter"
         )
-        return pd.DataFrame(payload[band_type.value][view.value]["data"])
+        return pd.DataFrame(payload[band_type][view]["data"])
 
     async def get_large_deals(
         self, deal_type: LargeDealType = LargeDealType.BULK
@@ -1564,7 +1856,7 @@ class NSEIndia:
         payload = await self.fetcher._fetch(
             "https://www.nseindia.com/api/snapshot-capital-market-largedeal"
         )
-        return pd.DataFrame(payload[f"{deal_type.value.upper()}_DATA"])
+        return pd.DataFrame(payload[f"{deal_type.upper()}_DATA"])
 
     async def get_large_deals_historical(
         self,
@@ -1588,15 +1880,15 @@ class NSEIndia:
             raise ValueError("Invalid date format.  Should be dd-mm-yyyy.")
 
         mode_str = (
-            deal_type.value.replace("_", "-")
-            if deal_type.value != "short_deals"
+            deal_type.replace("_", "-")
+            if deal_type != "short_deals"
             else "short-selling"
         )
         url = f"https://www.nseindia.com/api/historical/{mode_str}?from={from_date}&to={to_date}"
         data = await self.fetcher._fetch(url)
         return pd.DataFrame(data["data"])
 
-    def get_fao_participant_oi(self, date: str) -> pd.DataFrame:
+    async def get_fao_participant_oi(self, date: str) -> pd.DataFrame:
         """
         Fetches Participant Wise Open Interest data for a given date from the NSE archives.
 
@@ -1607,7 +1899,7 @@ class NSEIndia:
         try:
             date_formatted = date.replace("-", "")
             url = f"https://archives.nseindia.com/content/nsccl/fao_participant_oi_{date_formatted}.csv"
-            return pd.read_csv(url)
+            return await self.fetcher._fetch_csv(url)
         except Exception as e:
             logging.error(
                 f"Error fetching or processing FAO participant OI data for {date}: {e}"
@@ -1621,22 +1913,18 @@ class NSEIndia:
         :param segment: Market segment to check ('FO', 'COM' etc - refer MarketSegment Enum).
         :return: True if the market is open, False otherwise.
         """
-        holiday_json = await self.get_holidays()
-        holidays = holiday_json[segment.value]
-        today_date = datetime.date.today().strftime("%d-%b-%Y")
+        today = datetime.date.today()
 
-        if datetime.datetime.today().weekday() in [5, 6]:
+        if today.weekday() in [5, 6]:
             logging.info("Market is closed today because it's a weekend.")
             return False
 
-        for holiday in holidays:
-            if holiday["tradingDate"] == today_date:
-                logging.info(
-                    f"Market is closed today because of {holiday['description']}"
-                )
-                return False
+        holiday_dates, descriptions = await self._cached_holidays(HolidayType.TRADING, segment)
+        if today in holiday_dates:
+            logging.info(f"Market is closed today because of {descriptions[today]}")
+            return False
 
-        logging.info(f"{segment.value} Market is open today. Have a Nice Trade!")
+        logging.info(f"{segment} Market is open today. Have a Nice Trade!")
         return True  # Return True if no holiday matches today's date
 
     async def get_security_wise_archive(
@@ -1662,6 +1950,21 @@ class NSEIndia:
         data = await self.fetcher._fetch(url)
         return pd.DataFrame(data["data"])
 
+    async def _indicator_history(
+        self, symbol: str, days: int, data: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """
+        Equity history covering an indicator's window of `days` trading days up to today.
+        When data is passed in, it is trimmed to that window instead of fetching.
+        """
+        start_date = await self._get_past_trading_date(days)
+        if data is None:
+            end_date = _today_str(datetime.date.today().toordinal())
+            return await self.get_equity_history(symbol, start_date, end_date)
+
+        start = datetime.datetime.strptime(start_date, "%d-%m-%Y").date().isoformat()
+        return data[data["CH_TIMESTAMP"] >= start].reset_index(drop=True)
+
     async def get_simple_moving_average_absolute(self, symbol: str, start_date: str, end_date: str) -> float:
         """
         Calculates the Moving Average (MA) for a given stock symbol between the specified dates.
@@ -1673,93 +1976,125 @@ class NSEIndia:
         """
         try:
             data = await self.get_equity_history(symbol, start_date, end_date)
-            return round(data["CH_CLOSING_PRICE"].rolling(window=len(data)).mean().iloc[-1], 4)
+            closes = data["CH_CLOSING_PRICE"].to_numpy(np.float64)
+            return round(float(closes.sum()) / len(closes), 4)
         except Exception as e:
             logging.error(f"Error calculating Moving Average Absolute: {e}")
             return 0.0
 
-    async def get_simple_moving_average(self, symbol: str, days: int = 50) -> float:
+    async def get_simple_moving_average(self, symbol: str, days: int = 50, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Moving Average (MA) for a given stock symbol for the specified number of days,
         considering weekends and holidays.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the moving average. Default is 50.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Moving Average (MA) value.
         """
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-            return round(data["CH_CLOSING_PRICE"].rolling(window=days).mean().iloc[-1], 4)
+            data = await self._indicator_history(symbol, days, data)
+            closes = data["CH_CLOSING_PRICE"].to_numpy(np.float64)
+            return round(float(closes[-days:].mean()), 4) if len(closes) >= days else np.nan
         except Exception as e:
             logging.error(f"Error calculating Moving Average Relative: {e}")
             return 0.0
         
-    async def get_exponential_moving_average(self, symbol: str, days: int = 50) -> float:
+    async def get_simple_moving_averages(self, symbols: List[str], days: int = 50) -> Dict[str, float]:
+        """
+        Calculates the Moving Average (MA) of several stock symbols at once. Histories are fetched
+        concurrently and the last `days` closes of every symbol are averaged in one NumPy reduction.
+
+        :param symbols: List of stock symbols.
+        :param days: Number of days to consider for the moving average. Default is 50.
+        :return: Dictionary mapping each symbol to its MA value (0.0 if its history could not be fetched).
+        """
+        histories = await asyncio.gather(
+            *(self._indicator_history(symbol, days) for symbol in symbols), return_exceptions=True
+        )
+
+        # One column per symbol holding its last `days` closes; short histories stay NaN like rolling()
+        closes = np.full((days, len(symbols)), np.nan)
+        failed = set()
+        for column, (symbol, history) in enumerate(zip(symbols, histories)):
+            if isinstance(history, Exception):
+                logging.error(f"Error calculating Moving Average Relative for {symbol}: {history}")
+                failed.add(column)
+            elif isinstance(history, BaseException):
+                raise history
+            elif len(history) >= days:
+                closes[:, column] = history["CH_CLOSING_PRICE"].to_numpy(np.float64)[-days:]
+
+        averages = closes.mean(axis=0)
+        return {
+            symbol: 0.0 if column in failed else round(float(averages[column]), 4)
+            for column, symbol in enumerate(symbols)
+        }
+
+    async def get_exponential_moving_average(self, symbol: str, days: int = 50, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Exponential Moving Average (EMA) for a given stock symbol for the specified number of days,
         considering weekends and holidays.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the moving average. Default is 50.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Exponential Moving Average (EMA) value.
         """
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-
-            return round(data["CH_CLOSING_PRICE"].ewm(span=days, adjust=False).mean().iloc[-1], 4)
+            data = await self._indicator_history(symbol, days, data)
+            close = data["CH_CLOSING_PRICE"].to_numpy(np.float64)
+            return round(float(ewm_adjust_false(close, 2 / (days + 1))[-1]), 4)
         except Exception as e:
             logging.error(f"Error calculating Exponential Moving Average: {e}")
             return 0.0
         
-    async def get_double_exponential_moving_average(self, symbol: str, days: int = 50) -> float:
+    async def get_double_exponential_moving_average(self, symbol: str, days: int = 50, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Double Exponential Moving Average (DEMA) for a given stock symbol for the specified number of days,
         considering weekends and holidays.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the moving average. Default is 50.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Double Exponential Moving Average (DEMA) value.
         """
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-
-            ema = data["CH_CLOSING_PRICE"].ewm(span=days, adjust=False).mean()
-            dema = 2 * ema - ema.ewm(span=days, adjust=False).mean()
-            return round(dema.iloc[-1], 4)
+            data = await self._indicator_history(symbol, days, data)
+            alpha = 2 / (days + 1)
+            ema = ewm_adjust_false(data["CH_CLOSING_PRICE"].to_numpy(np.float64), alpha)
+            ema2 = ewm_adjust_false(ema, alpha)
+            return round(float(2 * ema[-1] - ema2[-1]), 4)
         except Exception as e:
             logging.error(f"Error calculating Double Exponential Moving Average: {e}")
             return 0.0
         
-    async def get_triple_exponential_moving_average(self, symbol: str, days: int = 50) -> float:
+    async def get_triple_exponential_moving_average(self, symbol: str, days: int = 50, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Triple Exponential Moving Average (TEMA) for a given stock symbol for the specified number of days,
         considering weekends and holidays.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the moving average. Default is 50.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Triple Exponential Moving Average (TEMA) value.
         """
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-
-            ema = data["CH_CLOSING_PRICE"].ewm(span=days, adjust=False).mean()
-            ema2 = ema.ewm(span=days, adjust=False).mean()
-            ema3 = ema2.ewm(span=days, adjust=False).mean()
-            tema = 3 * (ema - ema2) + ema3
-            return round(tema.iloc[-1], 4)
+            data = await self._indicator_history(symbol, days, data)
+            alpha = 2 / (days + 1)
+            ema = ewm_adjust_false(data["CH_CLOSING_PRICE"].to_numpy(np.float64), alpha)
+            ema2 = ewm_adjust_false(ema, alpha)
+            ema3 = ewm_adjust_false(ema2, alpha)
+            return round(float(3 * (ema[-1] - ema2[-1]) + ema3[-1]), 4)
         except Exception as e:
             logging.error(f"Error calculating Triple Exponential Moving Average: {e}")
             return 0.0
         
-    async def get_relative_strength_index(self, symbol: str, days: int = 14, wilder_smoothing: bool = False) -> float:
+    async def get_relative_strength_index(self, symbol: str, days: int = 14, wilder_smoothing: bool = False, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Relative Strength Index (RSI) for a given stock symbol for the specified number of days,
         considering weekends and holidays.
@@ -1767,181 +2102,171 @@ class NSEIndia:
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the RSI. Default is 14.
         :param wilder_smoothing: Use Wilder's smoothing method. Default is False.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Relative Strength Index (RSI) value.
         """
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-            delta = data["CH_CLOSING_PRICE"].diff()
-            
-            gains = delta.copy()
-            losses = delta.copy()
-            gains[gains < 0] = 0
-            losses[losses > 0] = 0
-            losses = abs(losses)
-            
-            avg_gain = gains.rolling(window=days).mean()
-            avg_loss = losses.rolling(window=days).mean()
+            data = await self._indicator_history(symbol, days, data)
+            delta = np.diff(data["CH_CLOSING_PRICE"].to_numpy(np.float64))
+
+            gains = np.maximum(delta, 0.0)
+            losses = np.maximum(-delta, 0.0)
 
             if wilder_smoothing:
-                for i in range(days, len(gains)):
-                    avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (days-1) + gains.iloc[i]) / days
-                    avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (days-1) + losses.iloc[i]) / days
-            
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            return round(rsi.iloc[-1], 4)
+                return round(float(wilder_rsi(gains, losses, days)), 4)
+
+            # Simple averages over the last `days` changes (NaN when there are fewer, like rolling())
+            if len(delta) < days:
+                return np.nan
+            avg_gain = gains[-days:].mean()
+            avg_loss = losses[-days:].mean()
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+            return round(float(rsi), 4)
         except Exception as e:
             logging.error(f"Error calculating Relative Strength Index: {e}")
             return 0.0
 
-    async def get_moving_average_convergence_divergence(self, symbol: str, get_signal: bool = False) -> Union[pd.Series, tuple[pd.Series, pd.Series]]:
+    async def get_moving_average_convergence_divergence(self, symbol: str, get_signal: bool = False, data: Optional[pd.DataFrame] = None, get_histogram: bool = False) -> Union[pd.Series, tuple[pd.Series, ...]]:
         """
         Calculates the Moving Average Convergence Divergence (MACD) for a given stock symbol.
         Uses standard periods: 12 for fast EMA, 26 for slow EMA, and 9 for signal line.
 
         :param symbol: The stock symbol.
         :param get_signal: If True, returns both MACD and signal line Series.
-        :return: MACD if get_signal is False, tuple of (MACD, signal) if True.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
+        :param get_histogram: If True, returns the MACD, signal line and histogram (MACD - signal) Series.
+        :return: MACD if get_signal is False, tuple of (MACD, signal) if True,
+            tuple of (MACD, signal, histogram) if get_histogram is True.
         """
         try:
-            start_date = await self._get_past_trading_date(days=50)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-            
-            exp12 = data["CH_CLOSING_PRICE"].ewm(span=12, adjust=False).mean()
-            exp26 = data["CH_CLOSING_PRICE"].ewm(span=26, adjust=False).mean()
-            macd_line = exp12 - exp26
-            
-            signal_line = macd_line.ewm(span=9, adjust=False).mean()
-            
+            data = await self._indicator_history(symbol, 50, data)
+            close = data["CH_CLOSING_PRICE"]
+
+            macd, signal, histogram = macd_lines(close.to_numpy(np.float64), 2 / 13, 2 / 27, 2 / 10)
+            macd_line = pd.Series(macd, index=close.index)
+
+            if get_histogram:
+                return (
+                    macd_line,
+                    pd.Series(signal, index=close.index),
+                    pd.Series(histogram, index=close.index),
+                )
             if get_signal:
-                return macd_line, signal_line
+                return macd_line, pd.Series(signal, index=close.index)
             return macd_line
-            
+
         except Exception as e:
             logging.error(f"Error calculating Moving Average Convergence Divergence: {e}")
+            if get_histogram:
+                return (0.0, 0.0, 0.0)
             return (0.0, 0.0) if get_signal else 0.0
 
-    async def get_stochastic_oscillator(self, symbol: str) -> float:
+    async def get_stochastic_oscillator(self, symbol: str, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Stochastic Oscillator for a given stock symbol.
         Uses standard period of 14 days.
 
         :param symbol: The stock symbol.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Stochastic Oscillator value.
         """
         try:
-            start_date = await self._get_past_trading_date(days=14)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
+            data = await self._indicator_history(symbol, 14, data)
+            high, low = rolling_high_low(
+                data["CH_TRADE_HIGH_PRICE"].to_numpy(np.float64),
+                data["CH_TRADE_LOW_PRICE"].to_numpy(np.float64),
+                14,
+            )
+            close = data["CH_CLOSING_PRICE"].to_numpy(np.float64)
 
-            low = data["CH_TRADE_LOW_PRICE"].rolling(window=14).min()
-            high = data["CH_TRADE_HIGH_PRICE"].rolling(window=14).max()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                k = 100 * (close[-1] - low[-1]) / (high[-1] - low[-1])
 
-            k = 100 * (data["CH_CLOSING_PRICE"] - low) / (high - low)
+            return round(float(k), 4)
 
-            return round(k.iloc[-1], 4)
-        
         except Exception as e:
             logging.error(f"Error calculating Stochastic Oscillator: {e}")
             return 0.0
         
-    async def get_bollinger_bands(self, symbol: str) -> tuple[float, float, float]:
+    async def get_bollinger_bands(self, symbol: str, data: Optional[pd.DataFrame] = None) -> tuple[float, float, float]:
         """
         Calculates the Bollinger Bands for a given stock symbol.
         Uses standard period of 20 days and 2 standard deviations.
 
         :param symbol: The stock symbol.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: A tuple containing the Bollinger Bands values: (upper, middle, lower).
         """
         try:
-            start_date = await self._get_past_trading_date(days=20)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-            
-            middle = data["CH_CLOSING_PRICE"].rolling(window=20).mean()
-            std = data["CH_CLOSING_PRICE"].rolling(window=20).std()
-            
-            upper = middle + 2 * std
-            lower = middle - 2 * std
-            
-            return round(upper.iloc[-1], 4), round(middle.iloc[-1], 4), round(lower.iloc[-1], 4)
+            data = await self._indicator_history(symbol, 20, data)
+
+            upper, middle, lower = bollinger_bands(data["CH_CLOSING_PRICE"].to_numpy(np.float64), 20, 2.0)
+
+            return round(float(upper[-1]), 4), round(float(middle[-1]), 4), round(float(lower[-1]), 4)
         
         except Exception as e:
             logging.error(f"Error calculating Bollinger Bands: {e}")
             return (0.0, 0.0, 0.0)
         
-    async def get_average_directional_index(self, symbol: str, days: int = 14) -> float:
+    async def get_average_directional_index(self, symbol: str, days: int = 14, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Average Directional Index (ADX) for a given stock symbol.
         Uses standard period of 14 days.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the ADX. Default is 14.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Average Directional Index (ADX) value.
         """
 
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-
-            high = data["CH_TRADE_HIGH_PRICE"]
-            low = data["CH_TRADE_LOW_PRICE"]
-            close = data["CH_CLOSING_PRICE"]
-
-            high_diff = high.diff()
-            low_diff = low.diff()
-
-            plus_dm = high_diff.copy()
-            minus_dm = low_diff.copy()
-
-            plus_dm[high_diff < 0] = 0
-            minus_dm[low_diff > 0] = 0
-
-            tr1 = high - low
-            tr2 = abs(high - close.shift(periods=1))
-            tr3 = abs(low - close.shift(periods=1))
+            # Wilder smoothing runs twice (DI, then ADX), so read 4x the period to let it settle
+            data = await self._indicator_history(symbol, 4 * days, data)
 
-            tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-            atr = tr.rolling(window=days).mean()
+            adx = wilder_adx(
+                data["CH_TRADE_HIGH_PRICE"].to_numpy(np.float64),
+                data["CH_TRADE_LOW_PRICE"].to_numpy(np.float64),
+                days,
+            )
+            return round(float(adx), 4)
 
-            plus_di = 100 * plus_dm.rolling(window=days).mean() / atr
-            minus_di = 100 * minus_dm.rolling(window=days).mean() / atr
-            
-            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-            
-            # TODO: This calculation is incorrect, gotta fix this
-            adx = dx.rolling(window=days).mean()
-            
-            return round(adx.iloc[-1], 4)
-        
         except Exception as e:
             logging.error(f"Error calculating Average Directional Index: {e}")
             return 0.0
 
-    async def get_commodity_channel_index(self, symbol: str, days: int = 20) -> pd.Series:
+    async def get_commodity_channel_index(self, symbol: str, days: int = 20, data: Optional[pd.DataFrame] = None) -> pd.Series:
         """
         Calculates the Commodity Channel Index (CCI) for a given stock symbol.
         Uses standard period of 20 days.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the CCI. Default is 20.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: The Commodity Channel Index (CCI) Series.
         """
 
         try:
             buffer_days = 2 * days
-            start_date = await self._get_past_trading_date(buffer_days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
+            data = await self._indicator_history(symbol, buffer_days, data)
 
             typical_price = (data["CH_TRADE_HIGH_PRICE"] + data["CH_TRADE_LOW_PRICE"] + data["CH_CLOSING_PRICE"]) / 3
             moving_average = typical_price.rolling(window=days).mean()
-            mean_average_deviation = typical_price.rolling(window=days).apply(lambda x: abs(x - x.mean()).mean())
+
+            # Mean absolute deviation of every window at once, on a (rows - days + 1, days) strided view
+            deviation = np.full(len(typical_price), np.nan)
+            if len(typical_price) >= days:
+                windows = sliding_window_view(typical_price.to_numpy(np.float64), days)
+                deviation[days - 1:] = np.abs(windows - windows.mean(axis=1, keepdims=True)).mean(axis=1)
+            mean_average_deviation = pd.Series(deviation, index=typical_price.index)
             cci = (typical_price - moving_average) / (0.015 * mean_average_deviation)
 
             return cci
@@ -1950,61 +2275,63 @@ class NSEIndia:
             logging.error(f"Error calculating Commodity Channel Index: {e}")
             return 0.0
 
-    async def get_ichimoku_cloud(self, symbol: str) -> float:
+    async def get_ichimoku_cloud(self, symbol: str, data: Optional[pd.DataFrame] = None) -> float:
         """
         Calculates the Ichimoku Cloud for a given stock symbol.
 
         :param symbol: The stock symbol.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: A tuple containing the Ichimoku Cloud values: (tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b, chikou_span).
         """
 
         try:
-            start_date = await self._get_past_trading_date(days=52)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
+            data = await self._indicator_history(symbol, 52, data)
 
-            high = data["CH_TRADE_HIGH_PRICE"]
-            low = data["CH_TRADE_LOW_PRICE"]
-            close = data["CH_CLOSING_PRICE"]
+            high = data["CH_TRADE_HIGH_PRICE"].to_numpy(np.float64)
+            low = data["CH_TRADE_LOW_PRICE"].to_numpy(np.float64)
 
-            tenkan_sen = (high.rolling(window=9).max() + low.rolling(window=9).min()) / 2
-            kijun_sen = (high.rolling(window=26).max() + low.rolling(window=26).min()) / 2
-            senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(periods=26)
-            senkou_span_b = ((high.rolling(window=52).max() + low.rolling(window=52).min()) / 2).shift(periods=26)
-            chikou_span = close.shift(periods=-26)
+            tenkan_sen = np.add(*rolling_high_low(high, low, 9)) / 2
+            kijun_sen = np.add(*rolling_high_low(high, low, 26)) / 2
+            span_b_line = np.add(*rolling_high_low(high, low, 52)) / 2
+
+            # The leading spans are plotted 26 sessions ahead, so today's values come from 26 sessions ago
+            if len(high) > 26:
+                senkou_span_a = (tenkan_sen[-27] + kijun_sen[-27]) / 2
+                senkou_span_b = span_b_line[-27]
+            else:
+                senkou_span_a = senkou_span_b = np.nan
+            # The lagging span is today's close plotted 26 sessions back; nothing lands on today
+            chikou_span = np.nan
 
             return (
-                round(tenkan_sen.iloc[-1], 4),
-                round(kijun_sen.iloc[-1], 4),
-                round(senkou_span_a.iloc[-1], 4),
-                round(senkou_span_b.iloc[-1], 4),
-                round(chikou_span.iloc[-1], 4),
+                round(float(tenkan_sen[-1]), 4),
+                round(float(kijun_sen[-1]), 4),
+                round(float(senkou_span_a), 4),
+                round(float(senkou_span_b), 4),
+                round(float(chikou_span), 4),
             )
 
         except Exception as e:
             logging.error(f"Error calculating Ichimoku Cloud: {e}")
             return (0.0, 0.0, 0.0, 0.0, 0.0)
 
-    async def get_fibonacci_retracement(self, symbol: str) -> tuple[float, float, float, float, float]:
+    async def get_fibonacci_retracement(self, symbol: str, data: Optional[pd.DataFrame] = None) -> tuple[float, float, float, float, float]:
         """
         Calculates the Fibonacci Retracement levels for a given stock symbol.
 
         :param symbol: The stock symbol.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: A tuple containing the Fibonacci Retracement levels: (23.6%, 38.2%, 50%, 61.8%, 78.6%).
         """
 
         try:
-            start_date = await self._get_past_trading_date(days=50)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
-
-            high = data["CH_TRADE_HIGH_PRICE"]
-            low = data["CH_TRADE_LOW_PRICE"]
-            close = data["CH_CLOSING_PRICE"]
+            data = await self._indicator_history(symbol, 50, data)
 
-            high_price = high.iloc[-1]
-            low_price = low.iloc[-1]
-            close_price = close.iloc[-1]
+            high_price = float(data["CH_TRADE_HIGH_PRICE"].to_numpy()[-1])
+            low_price = float(data["CH_TRADE_LOW_PRICE"].to_numpy()[-1])
+            close_price = float(data["CH_CLOSING_PRICE"].to_numpy()[-1])
 
             diff = high_price - low_price
             levels = [
@@ -2021,28 +2348,28 @@ class NSEIndia:
             logging.error(f"Error calculating Fibonacci Retracement: {e}")
             return (0.0, 0.0, 0.0, 0.0, 0.0)
 
-    async def get_support_and_resistance_levels(self, symbol: str, days: int) -> tuple[float, float]:
+    async def get_support_and_resistance_levels(self, symbol: str, days: int, data: Optional[pd.DataFrame] = None) -> tuple[float, float]:
         """
         Calculates the Support and Resistance levels for a given stock symbol.
 
         :param symbol: The stock symbol.
         :param days: Number of days to consider for the levels.
+        :param data: Equity history already fetched for the symbol; only the rows inside this
+            indicator's window are used. Fetched when omitted.
         :return: A tuple containing the Support and Resistance levels: (Support, Resistance).
         """
 
         try:
-            start_date = await self._get_past_trading_date(days)
-            end_date = datetime.datetime.now().strftime("%d-%m-%Y")
-            data = await self.get_equity_history(symbol, start_date, end_date)
+            data = await self._indicator_history(symbol, days, data)
 
-            high = data["CH_TRADE_HIGH_PRICE"]
-            low = data["CH_TRADE_LOW_PRICE"]
-            close = data["CH_CLOSING_PRICE"]
+            high = float(data["CH_TRADE_HIGH_PRICE"].to_numpy()[-1])
+            low = float(data["CH_TRADE_LOW_PRICE"].to_numpy()[-1])
+            close = float(data["CH_CLOSING_PRICE"].to_numpy()[-1])
 
-            pivot = (high.iloc[-1] + low.iloc[-1] + close.iloc[-1]) / 3
+            pivot = (high + low + close) / 3
 
-            support = (2 * pivot) - high.iloc[-1]
-            resistance = (2 * pivot) - low.iloc[-1]
+            support = (2 * pivot) - high
+            resistance = (2 * pivot) - low
 
             return (round(support, 4), round(resistance, 4))
 
@@ -2050,6 +2377,31 @@ class NSEIndia:
             logging.error(f"Error calculating Support and Resistance levels: {e}")
             return (0.0, 0.0)
 
+    async def compute_indicators(self, symbol: str, indicators: Optional[List[str]] = None) -> dict:
+        """
+        Calculates several indicators for a stock symbol from a single equity history fetch,
+        evaluating them concurrently. Each indicator uses its default parameters and gives the
+        same value as calling it directly.
+
+        :param symbol: The stock symbol.
+        :param indicators: Names from INDICATORS (e.g. ["sma", "rsi", "macd"]). Default is all of them.
+        :return: Dictionary mapping each indicator name to its value.
+        """
+        indicators = list(INDICATORS) if indicators is None else indicators
+        unknown = [name for name in indicators if name not in INDICATORS]
+        if unknown:
+            raise ValueError(f"Unknown indicators {unknown}. Must be any of {list(INDICATORS)}.")
+
+        if not indicators:
+            return {}
+
+        days = max(INDICATORS[name][1] for name in indicators)
+        data = await self._indicator_history(symbol, days)
+        results = await asyncio.gather(
+            *(getattr(self, INDICATORS[name][0])(symbol, data=data) for name in indicators)
+        )
+        return dict(zip(indicators, results))
+
 
 # async def main():
 #     from pprint import pprint
@@ -1,36 +1,101 @@
 # Client side wrapper for NSE API
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
+import logging
+import time
+from collections import OrderedDict
+from urllib.parse import quote
+from urllib.parse import urlencode
+
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
 from stockfetch.core.data_api_client import DataAPIClient
 
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response is served as fresh, then as stale while it is refreshed in the background
+CACHING_TTL = 60
+SWR_TTL = 3600
+# Cached responses kept at most, least recently used dropped first
+CACHE_MAX_ENTRIES = 1024
+# The holiday calendar changes at most once a day
+HOLIDAYS_TTL = 24 * 3600
+HOLIDAY_SEGMENT = 'CM'
+# Requests in flight at once, the least time between two request starts, and how often / how long
+# to back off when NSE answers 429, a transient gateway error or a malformed page
+MAX_CONCURRENT_REQUESTS = 8
+MIN_REQUEST_INTERVAL = 0.1
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 0.5
+# Longest date range NSE serves from one historical request
+HISTORY_CHUNK_DAYS = 90
+# Endpoints with their fixed query parameters encoded once; only the symbol and dates vary per call
+HOLIDAYS_ENDPOINT = 'holiday-master?' + urlencode({'type': 'trading'})
+HISTORY_ENDPOINT_TEMPLATE = (
+    'historical/cm/equity?'
+    + urlencode({'series': json.dumps(['EQ'])}, quote_via=quote)
+    + '&symbol={symbol}&from={start_date}&to={end_date}'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_component(value: str) -> str:
+    # Symbols and dates repeat across requests, so each is percent-encoded once
+    return quote(value, safe='')
+
 
 class NSE_Client(DataAPIClient):
+    base_api_url: str = 'https://www.nseindia.com/api'
+    home_url: str = 'https://www.nseindia.com/'
+    # Built once for the class and normalized into httpx.Headers, so the per-request merge into the
+    # shared client's headers copies them instead of re-encoding every name and value
+    headers: httpx.Headers = httpx.Headers({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+        'Accept-Language': 'en-US,en;q=0.9,en-IN;q=0.8,en-GB;q=0.7',
+        'Connection': 'keep-alive',
+        'Cache-Control': 'no-cache, no-store, must-revalidate',
+        'Pragma': 'no-cache',
+        'Expires': '0',
+    })
+    OHLC_COLUMNS = {
+        'timestamp': 'CH_TIMESTAMP',
+        'open': 'CH_OPENING_PRICE',
+        'high': 'CH_TRADE_HIGH_PRICE',
+        'low': 'CH_TRADE_LOW_PRICE',
+        'close': 'CH_CLOSING_PRICE',
+        'volume': 'CH_TOT_TRADED_QTY',
+    }
+    HOLIDAY_DATE_FORMAT = '%d-%b-%Y'
+
     def __init__(self):
         super().__init__()
-        print('➡️ NSE India client initialized')
-        self.base_api_url: str = 'https://www.nseindia.com/api'
-        self.home_url: str = 'https://www.nseindia.com/'
-        self.headers: dict = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 \
-            (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9,en-IN;q=0.8,en-GB;q=0.7',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache, no-store, must-revalidate',
-            'Pragma': 'no-cache',
-            'Expires': '0',
-        }
-        self.client = httpx.Client(
-            headers=self.headers,
-            follow_redirects=True,
-            timeout=30.0,
-        )
-        self._init_session()
+        logger.debug('NSE India client initialized')
+        # Canonical request URL -> (time.monotonic() of the fetch, raw JSON body), in LRU order; the body
+        # is decoded on every hit, so callers each get their own payload and cannot corrupt the cache
+        self._cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._next_request_at = 0.0
+
+    async def __aenter__(self):
+        await self._init_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
 
-    def _init_session(self):
+    async def _init_session(self):
         try:
-            response = self.client.get(self.home_url)
+            async with self._sem:
+                response = await self.client.get(self.home_url, headers=self.headers)
             if response.status_code == 200:
                 print('✅ Session initialized successfully')
             else:
@@ -40,70 +105,194 @@ class NSE_Client(DataAPIClient):
         except Exception as e:
             print(f"❌ Session initialization error: {e}")
 
-    def __del__(self):
-        self.client.close()
+    async def aclose(self):
+        # The HTTP client is shared with other clients; DataAPIClient.close_client() closes it
+        for task in self._refresh_tasks.values():
+            task.cancel()
         print('➡️ NSE India client deinitialized')
 
-    def _encode_uri(self, uri):
-        encoded_uri = uri.replace(' ', '%20')
-        encoded_uri = encoded_uri.replace('"', '%22')
-        return encoded_uri
+    def clear_cache(self):
+        self._cache.clear()
 
-    def _build_request(self, endpoint: str, params: dict):
-        request_url = f"{self.base_api_url}/{endpoint}"
+    async def _throttle(self):
+        # Space request starts MIN_REQUEST_INTERVAL apart; NSE serves broken pages when hit in bursts
+        now = time.monotonic()
+        wait = self._next_request_at - now
+        self._next_request_at = max(now, self._next_request_at) + MIN_REQUEST_INTERVAL
+        if wait > 0:
+            await asyncio.sleep(wait)
 
-        if params:
-            request_url = f"{request_url}?"
-            for key, value in params.items():
-                request_url = f"{request_url}{key}={value}&"
+    async def _request(self, url: str) -> bytes | None:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._sem:
+                    await self._throttle()
+                    response = await self.client.get(url, headers=self.headers)
+            except httpx.TransportError as e:
+                # Timeouts and dropped connections are NSE's most common failures, so they are retried too
+                response = None
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code == 200:
+                    try:
+                        orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
+                        # Under load NSE can answer 200 with an HTML error page instead of JSON
+                        reason = 'Malformed response'
+                    else:
+                        print('✅ Response Fetched')
+                        return response.content
+                elif response.status_code in RETRY_STATUS_CODES:
+                    reason = f"Status code {response.status_code}"
+                else:
+                    break
+            if attempt == MAX_RETRIES:
+                break
+            # Wait as told by Retry-After, else back off exponentially (outside the semaphore)
+            retry_after = '' if response is None else response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else BACKOFF_SECONDS * 2 ** attempt
+            print(f"⏳ {reason}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+        if response is None:
+            print(f"❌ {reason}")
+        elif response.status_code == 200:
+            print('❌ Malformed response')
+        else:
+            print(f"❌ Status code: {response.status_code}")
+        return None
+
+    async def _fetch_and_cache(self, url: str) -> bytes | None:
+        content = await self._request(url)
+        if content is not None:
+            self._cache[url] = (time.monotonic(), content)
+            self._cache.move_to_end(url)
+            if len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return content
 
-        request_url = self._encode_uri(request_url)
-        return request_url
+    async def _refresh(self, url: str):
+        # Concurrent misses for the same URL share one request; shield() keeps a cancelled caller
+        # from cancelling it for the others
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._inflight[url] = asyncio.create_task(self._fetch_and_cache(url))
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
 
-    def get_market_holidays(self):
-        endpoint = 'holiday-master'
-        params = {'type': 'trading'}
-        endpoint_url = self._build_request(endpoint, params)
+    async def _revalidate(self, url: str):
         try:
-            response = self.client.get(endpoint_url)
-            if response.status_code == 200:
-                print('✅ Response Fetched')
-                return response.json()
-            else:
-                print(f"❌ Status code: {response.status_code}")
+            await self._refresh(url)
         except Exception as e:
             print(f"Error Occured:{e}")
+        finally:
+            self._refresh_tasks.pop(url, None)
 
-    def get_historical_ohlc_data(
+    async def _get(self, url: str, ttl: float = CACHING_TTL):
+        # Stale-while-revalidate: fresh entries are returned as is, stale ones are returned while a
+        # background task refetches them, and only a miss waits on the network
+        entry = self._cache.get(url)
+        if entry is not None:
+            self._cache.move_to_end(url)
+            age = time.monotonic() - entry[0]
+            if age < ttl:
+                return orjson.loads(entry[1])
+            if age < ttl + SWR_TTL:
+                if url not in self._refresh_tasks:
+                    self._refresh_tasks[url] = asyncio.create_task(
+                        self._revalidate(url),
+                    )
+                return orjson.loads(entry[1])
+        content = await self._refresh(url)
+        return None if content is None else orjson.loads(content)
+
+    async def get_market_holidays(self):
+        endpoint_url = f"{self.base_api_url}/{HOLIDAYS_ENDPOINT}"
+        try:
+            return await self._get(endpoint_url, ttl=HOLIDAYS_TTL)
+        except Exception as e:
+            print(f"Error Occured:{e}")
+
+    def _holiday_dates(self, holidays: dict) -> np.ndarray:
+        # Capital market segment holidays, listed as e.g. {'tradingDate': '26-Jan-2024'}
+        return np.array(
+            [
+                self._parse_date(holiday['tradingDate'], self.HOLIDAY_DATE_FORMAT)
+                for holiday in holidays.get(HOLIDAY_SEGMENT, [])
+            ],
+            dtype=np.int64,
+        ).astype('datetime64[D]')
+
+    async def get_historical_ohlc_data(
         self,
         symbol,
         start_date,
         end_date,
         data_directory_path=None,
+        dump=False,
     ):
-        endpoint = 'historical/cm/equity'
-
-        params = {
-            'symbol': symbol,
-            'series': '[%22EQ%22]',
-            'from': start_date,
-            'to': end_date,
-        }
-        endpoint_url = self._build_request(endpoint, params)
+        dump_directory = self._dump_directory(data_directory_path, dump)
+        endpoint = HISTORY_ENDPOINT_TEMPLATE.format(
+            symbol=_quote_component(symbol),
+            start_date=_quote_component(start_date),
+            end_date=_quote_component(end_date),
+        )
+        endpoint_url = f"{self.base_api_url}/{endpoint}"
         try:
-            response = self.client.get(endpoint_url)
-            if response.status_code == 200:
-                print('✅ Response Fetched')
-                response_dataframe = pd.DataFrame(response.json()['data'])
-                if data_directory_path:
+            # A range that ended before today will not change, so it never goes stale
+            ended = self._parse_date(end_date) < self._today_epoch_day()
+            payload = await self._get(
+                endpoint_url,
+                ttl=float('inf') if ended else CACHING_TTL,
+            )
+            if payload is not None:
+                response_dataframe = pd.DataFrame(payload['data'])
+                if dump_directory is not None:
                     self._dump_data(
                         response_dataframe,
                         'test_dump',
-                        data_directory_path,
+                        dump_directory,
                         compress=False,
                     )
                 return response_dataframe
-            else:
-                print(f"❌ Status code: {response.status_code}")
         except Exception as e:
             print(f"Error Occured:{e}")
+
+    async def get_historical_ohlc_range(
+        self,
+        symbol,
+        start_date,
+        end_date,
+        data_directory_path=None,
+        dump=False,
+    ):
+        dump_directory = self._dump_directory(data_directory_path, dump)
+        # Split the range into windows NSE will serve and fetch them all at once (the semaphore
+        # still bounds how many are in flight)
+        start = self._parse_date(start_date)
+        end = self._parse_date(end_date)
+        windows = []
+        while start <= end:
+            window_end = min(start + HISTORY_CHUNK_DAYS - 1, end)
+            windows.append((self._format_date(start), self._format_date(window_end)))
+            start = window_end + 1
+
+        frames = await asyncio.gather(
+            *(
+                self.get_historical_ohlc_data(symbol, window_start, window_end)
+                for window_start, window_end in windows
+            ),
+        )
+        if any(frame is None for frame in frames):
+            print(f"❌ Could not fetch every window of {symbol} history")
+            return None
+
+        # NSE returns the newest rows first, so the latest window goes first as well
+        response_dataframe = pd.concat(frames[::-1], ignore_index=True, copy=False)
+        if dump_directory is not None:
+            self._dump_data(
+                response_dataframe,
+                'test_dump',
+                dump_directory,
+                compress=False,
+            )
+        return response_dataframe
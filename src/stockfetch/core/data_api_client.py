@@ -1,36 +1,150 @@
 # Factory class for different Stock Market APIs
 from __future__ import annotations
 
+import asyncio
 import datetime
-import json
+import functools
+import logging
 import os
+import pathlib
 import pickle
+import tempfile
+import threading
+import warnings
 from abc import ABC
 from abc import abstractmethod
+from collections import OrderedDict
+from dataclasses import fields
+from typing import ClassVar
 
+import httpx
+import numpy as np
+import orjson
 import pandas
+from stockfetch.core.ohlc import OHLC
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Client setup is logged at DEBUG; see it with logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Write buffer for dump files, so a large dump goes out in a few write() calls instead of one per 8 KiB
+DUMP_BUFFER_SIZE = 1 << 20
+# On-disk OHLC cache: zstd Parquet when pyarrow is installed, pickle otherwise
+OHLC_CACHE_EXTENSION = '.parquet' if PYARROW_AVAILABLE else '.pkl'
+OHLC_CACHE_RANGE_KEY = b'stockfetch_ohlc_range'
+# Parquet cache files kept memory-mapped per client, least recently read dropped first
+OHLC_MMAP_CACHE_SIZE = 128
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+@functools.lru_cache(maxsize=1024)
+def _epoch_day(value: str, date_format: str) -> int:
+    # Date string as days since 1970-01-01, so date-range math is plain integer comparison
+    return datetime.datetime.strptime(value, date_format).toordinal() - _EPOCH_ORDINAL
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_directory(path: str | os.PathLike) -> pathlib.Path:
+    # Relative paths resolve against the working directory once per distinct path
+    return pathlib.Path(path).resolve()
+
+
+def _format_epoch_day(epoch_day: int, date_format: str) -> str:
+    return datetime.date.fromordinal(epoch_day + _EPOCH_ORDINAL).strftime(date_format)
+
+
+def _epoch_days(dates: pandas.Series) -> np.ndarray:
+    # Whole date column to days since 1970-01-01 in one vectorized conversion
+    return pandas.to_datetime(dates).to_numpy().astype('datetime64[D]').astype(np.int64)
 
 
 class DataAPIClient(ABC):
+    # One pooled client for every DataAPIClient instance and subclass, created on first use
+    _shared_client: ClassVar[httpx.AsyncClient | None] = None
+    # Column with each OHLC row's trading date, for get_historical_ohlc_data_cached; taken from
+    # OHLC_COLUMNS when a subclass only sets that
+    OHLC_DATE_COLUMN: ClassVar[str | None] = None
+    # Format of the start_date / end_date arguments; subclasses of APIs that use another one override it
+    DATE_FORMAT: ClassVar[str] = '%d-%m-%Y'
+    # OHLC field name -> column of the API's rows; subclasses set it to use get_historical_ohlc
+    OHLC_COLUMNS: ClassVar[dict[str, str] | None] = None
+
+    def __init_subclass__(cls, **kwargs):
+        # Subclass configuration is checked and completed once, when the subclass is defined,
+        # instead of on every instantiation
+        super().__init_subclass__(**kwargs)
+        if cls.OHLC_COLUMNS is not None:
+            missing = {field.name for field in fields(OHLC)} - cls.OHLC_COLUMNS.keys()
+            if missing:
+                raise TypeError(f"{cls.__name__}.OHLC_COLUMNS lacks {', '.join(sorted(missing))}")
+            if cls.OHLC_DATE_COLUMN is None:
+                cls.OHLC_DATE_COLUMN = cls.OHLC_COLUMNS['timestamp']
+
     def __init__(self):
-        print('✅ Stock API Client initialized')
-        self.data_directory_path = None
+        logger.debug('Stock API Client initialized')
+        self.data_directory_path: pathlib.Path | None = None
+        self._dirs_created: set[str] = set()
+        self._cached_date: datetime.date | None = None
+        self._today_str: str = ''
+        # Cache file path -> (mtime_ns, memory map); reads run on worker threads, hence the lock
+        self._mmap_cache: OrderedDict[pathlib.Path, tuple[int, pyarrow.MemoryMappedFile]] = OrderedDict()
+        self._mmap_lock = threading.Lock()
+        # (holidays payload it was built from, packed holiday bits, first holiday epoch day, days covered)
+        self._holiday_bitset: tuple[dict, np.ndarray, int, int] | None = None
 
-    # API Request handling
-    @abstractmethod
-    def _build_request(self, url: str, params: dict) -> str:
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
         """_summary_
-        Abstract method to build request for fetching stock data.
-        Args:
-            url (str): url endpoint for stock API
-            params (dict): parameters for stock API
-
+        Shared HTTP client; HTTP/2 multiplexes the requests of all clients over pooled keep-alive
+        connections. A new one is created if it was closed.
         Returns:
-            str: endpoint url with parameters
+            httpx.AsyncClient: Shared HTTP client
         """
+        client = DataAPIClient._shared_client
+        if client is None or client.is_closed:
+            client = DataAPIClient._shared_client = httpx.AsyncClient(
+                follow_redirects=True,
+                # Fail fast on an unreachable host, but leave slow historical responses time to arrive
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                http2=True,
+                # HTTP/2 multiplexes requests per host over one connection, so a small pool is plenty
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=16,
+                ),
+            )
+        return client
 
+    @classmethod
+    async def close_client(cls) -> None:
+        """_summary_
+        Close the shared HTTP client, before its event loop ends.
+        """
+        if DataAPIClient._shared_client is not None:
+            await DataAPIClient._shared_client.aclose()
+            DataAPIClient._shared_client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return DataAPIClient.get_client()
+
+    # API Request handling
     @abstractmethod
-    def get_market_holidays(self) -> dict:
+    async def get_market_holidays(self) -> dict:
         """_summary_
         Abstract method to get market holidays.
         Returns:
@@ -39,12 +153,13 @@ class DataAPIClient(ABC):
         pass
 
     @abstractmethod
-    def get_historical_ohlc_data(
+    async def get_historical_ohlc_data(
         self,
         symbol: str,
         start_date: str,
         end_date: str,
-        data_directory_path: str,
+        data_directory_path: str | None = None,
+        dump: bool = False,
     ) -> pandas.DataFrame:
         """_summary_
         Abstract method to get equity OHLC data.
@@ -52,19 +167,411 @@ class DataAPIClient(ABC):
             symbol (str): Stock symbol
             start_date (str): Start date for data
             end_date (str): End date for data
+            data_directory_path (str, optional): Deprecated, dump into this directory; use
+                set_data_directory_path() and dump=True instead. Defaults to None.
+            dump (bool, optional): Dump the data into the data directory. Defaults to False.
 
         Returns:
             pandas.DataFrame: OHLC data
         """
         pass
 
+    def _holiday_dates(self, holidays: dict) -> np.ndarray:
+        """_summary_
+        Trading holidays listed in a get_market_holidays() payload. Subclasses override it to parse
+        their API's payload; by default none are known, so only weekends count as non-trading days.
+        Args:
+            holidays (dict): Market holidays
+
+        Returns:
+            np.ndarray: Holiday dates as datetime64[D]
+        """
+        return np.empty(0, dtype='datetime64[D]')
+
+    def _build_holiday_bitset(self, holidays: dict) -> tuple[dict, np.ndarray, int, int]:
+        days = self._holiday_dates(holidays).astype('datetime64[D]').astype(np.int64)
+        if len(days) == 0:
+            return holidays, np.zeros(1, dtype=np.uint8), 0, 0
+        origin = int(days.min())
+        span = int(days.max()) - origin + 1
+        bits = np.zeros(span, dtype=bool)
+        bits[days - origin] = True
+        return holidays, np.packbits(bits, bitorder='little'), origin, span
+
+    async def trading_day_mask(self, days: np.ndarray) -> np.ndarray | None:
+        """_summary_
+        Which of the given days the market trades on: weekdays that are not market holidays.
+        The holidays are packed into a bitset once per holidays payload, so every day is one bit test.
+        Args:
+            days (np.ndarray): Days, as datetime64 or anything numpy converts to datetime64[D]
+
+        Returns:
+            np.ndarray | None: Boolean mask, True on trading days; None when holidays are unavailable
+        """
+        holidays = await self.get_market_holidays()
+        if holidays is None:
+            return None
+        if self._holiday_bitset is None or self._holiday_bitset[0] != holidays:
+            self._holiday_bitset = self._build_holiday_bitset(holidays)
+        _, packed, origin, span = self._holiday_bitset
+
+        epoch_days = np.asarray(days, dtype='datetime64[D]').astype(np.int64)
+        offsets = epoch_days - origin
+        in_span = (offsets >= 0) & (offsets < span)
+        offsets = np.where(in_span, offsets, 0)
+        holiday = in_span & ((packed[offsets >> 3] >> (offsets & 7)) & 1).astype(bool)
+        # 1970-01-01 was a Thursday, so (day + 3) % 7 counts weekdays from Monday = 0
+        weekend = (epoch_days + 3) % 7 >= 5
+        return ~(holiday | weekend)
+
+    async def _trading_day_gaps(self, gaps: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        # Narrow each gap to its first and last trading day, dropping gaps without any, so weekends
+        # and holidays at the edges of a cached range never cost a request
+        days = np.concatenate([np.arange(gap_start, gap_end + 1) for gap_start, gap_end in gaps])
+        mask = await self.trading_day_mask(days.astype('datetime64[D]'))
+        if mask is None:
+            return gaps
+        trimmed = []
+        for gap_start, gap_end in gaps:
+            trading = days[mask & (days >= gap_start) & (days <= gap_end)]
+            if len(trading):
+                trimmed.append((int(trading[0]), int(trading[-1])))
+        return trimmed
+
+    async def get_historical_ohlc_range(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        data_directory_path: str | None = None,
+        dump: bool = False,
+    ) -> pandas.DataFrame | None:
+        """_summary_
+        Get equity OHLC data over any date range. Defaults to a single get_historical_ohlc_data call;
+        subclasses whose API caps the range per request split it here.
+        Args:
+            symbol (str): Stock symbol
+            start_date (str): Start date for data
+            end_date (str): End date for data
+            data_directory_path (str, optional): Deprecated, see get_historical_ohlc_data. Defaults to None.
+            dump (bool, optional): Dump the data into the data directory. Defaults to False.
+
+        Returns:
+            pandas.DataFrame | None: OHLC data
+        """
+        return await self.get_historical_ohlc_data(
+            symbol,
+            start_date,
+            end_date,
+            data_directory_path=data_directory_path,
+            dump=dump,
+        )
+
+    async def get_historical_ohlc(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+    ) -> OHLC | None:
+        """_summary_
+        Get equity OHLC data as a columnar OHLC container instead of the API's raw DataFrame.
+        Args:
+            symbol (str): Stock symbol
+            start_date (str): Start date for data
+            end_date (str): End date for data
+
+        Returns:
+            OHLC | None: OHLC data in chronological order
+        """
+        if self.OHLC_COLUMNS is None:
+            raise NotImplementedError(f"{type(self).__name__} does not define OHLC_COLUMNS")
+        data = await self.get_historical_ohlc_range(symbol, start_date, end_date)
+        if data is None:
+            return None
+        return OHLC.from_pandas(data, self.OHLC_COLUMNS)
+
+    async def get_historical_ohlc_data_cached(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+    ) -> pandas.DataFrame | None:
+        """_summary_
+        Get equity OHLC data through a per-symbol cache file in the data directory. Only the parts of
+        the range the file does not cover yet are fetched, trimmed to trading days, then merged into it;
+        days from today on are always refetched since they can still change.
+        Args:
+            symbol (str): Stock symbol
+            start_date (str): Start date for data, DD-MM-YYYY
+            end_date (str): End date for data, DD-MM-YYYY
+
+        Returns:
+            pandas.DataFrame | None: OHLC data in chronological order
+        """
+        date_column = self.OHLC_DATE_COLUMN
+        if self.data_directory_path is None or date_column is None:
+            print('❌ OHLC cache needs a data directory and OHLC_DATE_COLUMN, fetching without it')
+            return await self.get_historical_ohlc_range(symbol, start_date, end_date)
+
+        start = self._parse_date(start_date)
+        end = self._parse_date(end_date)
+        cache_path = self._cache_path(symbol)
+        cached = await asyncio.to_thread(self._read_ohlc_cache, cache_path)
+
+        if cached is None:
+            frames = []
+            gaps = [(start, end)]
+            covered = (start, end)
+        else:
+            frame, (cached_start, cached_end) = cached
+            frames = [frame]
+            gaps = []
+            if start < cached_start:
+                gaps.append((start, cached_start - 1))
+            if end > cached_end:
+                gaps.append((cached_end + 1, end))
+            covered = (min(start, cached_start), max(end, cached_end))
+
+        fetch_gaps = await self._trading_day_gaps(gaps) if gaps else []
+        if fetch_gaps:
+            fetched = await asyncio.gather(
+                *(
+                    self.get_historical_ohlc_range(
+                        symbol,
+                        self._format_date(gap_start),
+                        self._format_date(gap_end),
+                    )
+                    for gap_start, gap_end in fetch_gaps
+                ),
+            )
+            if any(frame is None for frame in fetched):
+                print(f"❌ Could not fetch uncached {symbol} history")
+                return None
+            frames.extend(fetched)
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pandas.DataFrame()
+        data = pandas.concat(frames, ignore_index=True, copy=False) if len(frames) > 1 else frames[0]
+
+        if gaps:
+            # Fetched rows come after the cached ones, so keep='last' prefers the fresh copy of a day
+            data = data.drop_duplicates(subset=date_column, keep='last')
+            dates = _epoch_days(data[date_column])
+            order = np.argsort(dates, kind='stable')
+            data = data.iloc[order].reset_index(drop=True)
+            dates = dates[order]
+            # Today's rows may still change, so the covered range stops at yesterday
+            covered = (covered[0], min(covered[1], self._today_epoch_day() - 1))
+            if covered[0] <= covered[1]:
+                await asyncio.to_thread(self._write_ohlc_cache, cache_path, data, covered)
+        else:
+            dates = _epoch_days(data[date_column])
+
+        # Rows are in date order, so the requested range is one contiguous slice
+        first = np.searchsorted(dates, start, side='left')
+        last = np.searchsorted(dates, end, side='right')
+        return data.iloc[first:last].reset_index(drop=True)
+
+    async def get_historical_ohlc_data_batch(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+        max_concurrency: int = 8,
+        cached: bool = False,
+    ) -> dict[str, pandas.DataFrame | Exception | None]:
+        """_summary_
+        Get equity OHLC data of several symbols concurrently, at most max_concurrency at a time.
+        Args:
+            symbols (list[str]): Stock symbols
+            start_date (str): Start date for data
+            end_date (str): End date for data
+            max_concurrency (int, optional): Fetches in flight at once. Defaults to 8.
+            cached (bool, optional): Go through get_historical_ohlc_data_cached, whose cache files are
+                then read on worker threads side by side. Defaults to False.
+
+        Returns:
+            dict[str, pandas.DataFrame | Exception | None]: OHLC data (or the error raised) per symbol
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        get_data = self.get_historical_ohlc_data_cached if cached else self.get_historical_ohlc_data
+
+        async def fetch(symbol: str) -> pandas.DataFrame | None:
+            async with semaphore:
+                return await get_data(symbol, start_date, end_date)
+
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return dict(zip(symbols, results))
+
+    def _parse_date(self, value: str, date_format: str | None = None) -> int:
+        """_summary_
+        Parse a date, memoized across calls and clients.
+        Args:
+            value (str): Date
+            date_format (str, optional): Format of value. Defaults to DATE_FORMAT.
+
+        Returns:
+            int: Days since 1970-01-01
+        """
+        return _epoch_day(value, date_format or self.DATE_FORMAT)
+
+    def _format_date(self, epoch_day: int) -> str:
+        """_summary_
+        Format a day as a date argument in DATE_FORMAT.
+        Args:
+            epoch_day (int): Days since 1970-01-01
+
+        Returns:
+            str: Date
+        """
+        return _format_epoch_day(epoch_day, self.DATE_FORMAT)
+
+    @staticmethod
+    def _today_epoch_day() -> int:
+        return datetime.date.today().toordinal() - _EPOCH_ORDINAL
+
     # API Response Handling
 
+    def _dump_directory(self, data_directory_path: str | None, dump: bool) -> pathlib.Path | None:
+        """_summary_
+        Directory a getter should dump its data into, if any.
+        Args:
+            data_directory_path (str | None): Deprecated per-call directory
+            dump (bool): Dump into the data directory
+
+        Returns:
+            pathlib.Path | None: Dump directory, None to not dump
+        """
+        if data_directory_path is not None:
+            warnings.warn(
+                'data_directory_path is deprecated; call set_data_directory_path() once and pass dump=True',
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            return _resolve_directory(data_directory_path)
+        if dump and self.data_directory_path is None:
+            print('❌ No data directory set, call set_data_directory_path() to dump data')
+        return self.data_directory_path if dump else None
+
+    def _cache_path(self, symbol: str) -> pathlib.Path:
+        """_summary_
+        Path of a symbol's OHLC cache file in the data directory.
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            pathlib.Path: Cache file path
+        """
+        return self.data_directory_path / f"{symbol}{OHLC_CACHE_EXTENSION}"
+
+    def _memory_map(self, cache_path: pathlib.Path) -> pyarrow.MemoryMappedFile:
+        """_summary_
+        Memory map of a Parquet cache file, reused across reads until the file is rewritten.
+        Args:
+            cache_path (pathlib.Path): Cache file path
+
+        Returns:
+            pyarrow.MemoryMappedFile: Read-only memory map of the file
+        """
+        mtime = os.stat(cache_path).st_mtime_ns
+        with self._mmap_lock:
+            entry = self._mmap_cache.get(cache_path)
+            if entry is not None and entry[0] == mtime:
+                self._mmap_cache.move_to_end(cache_path)
+                return entry[1]
+            # Replaced maps are not closed here: tables read from them may still use their pages,
+            # and pyarrow unmaps them once the last reference is gone
+            mapped = pyarrow.memory_map(str(cache_path), 'r')
+            self._mmap_cache[cache_path] = (mtime, mapped)
+            if len(self._mmap_cache) > OHLC_MMAP_CACHE_SIZE:
+                self._mmap_cache.popitem(last=False)
+            return mapped
+
+    def _read_ohlc_cache(
+        self,
+        cache_path: pathlib.Path,
+    ) -> tuple[pandas.DataFrame, tuple[int, int]] | None:
+        """_summary_
+        Read an OHLC cache file together with the date range it covers.
+        Args:
+            cache_path (pathlib.Path): Cache file path
+
+        Returns:
+            tuple | None: (OHLC data, (first, last) covered day since 1970-01-01), None without a cache file
+        """
+        if not cache_path.exists():
+            return None
+        if PYARROW_AVAILABLE:
+            table = pyarrow.parquet.read_table(self._memory_map(cache_path))
+            first, last = orjson.loads(table.schema.metadata[OHLC_CACHE_RANGE_KEY])
+            return table.to_pandas(), (first, last)
+        with open(cache_path, 'rb') as f:
+            covered, data = pickle.load(f)
+        return data, covered
+
+    def _write_ohlc_cache(
+        self,
+        cache_path: pathlib.Path,
+        data: pandas.DataFrame,
+        covered: tuple[int, int],
+    ) -> None:
+        """_summary_
+        Write an OHLC cache file and the date range it covers, replacing the old file atomically.
+        Args:
+            cache_path (pathlib.Path): Cache file path
+            data (pandas.DataFrame): OHLC data
+            covered (tuple[int, int]): First and last covered day, as days since 1970-01-01
+        """
+        # A uniquely named temp file per write, so concurrent writes of one symbol never share it
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent,
+            prefix=cache_path.name + '.',
+            suffix='.tmp',
+            buffering=DUMP_BUFFER_SIZE,
+            delete=False,
+        ) as f:
+            temp_path = f.name
+            try:
+                if PYARROW_AVAILABLE:
+                    table = pyarrow.Table.from_pandas(data, preserve_index=False)
+                    table = table.replace_schema_metadata({
+                        **(table.schema.metadata or {}),
+                        OHLC_CACHE_RANGE_KEY: orjson.dumps(covered),
+                    })
+                    pyarrow.parquet.write_table(table, f, compression='zstd')
+                else:
+                    pickle.dump((covered, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                f.close()
+                os.remove(temp_path)
+                raise
+        # An open map keeps Windows from replacing the file, so the cached one is dropped first (a read
+        # still using it keeps it alive until it finishes); holding the lock keeps readers from mapping
+        # the old file again in between
+        with self._mmap_lock:
+            self._mmap_cache.pop(cache_path, None)
+            os.replace(temp_path, cache_path)
+
+    def _today(self) -> str:
+        """_summary_
+        Today's date as YYYY-MM-DD, formatted once per day.
+        Returns:
+            str: Today's date
+        """
+        today = datetime.date.today()
+        if self._cached_date != today:
+            self._cached_date, self._today_str = today, today.isoformat()
+        return self._today_str
+
     def _dump_data(
         self,
         data: dict | pandas.DataFrame | list | str,
         file_name: str,
-        data_directory_path: str,
+        data_directory_path: str | os.PathLike,
         compress: bool = False,
     ) -> None:
         """_summary_
@@ -72,54 +579,85 @@ class DataAPIClient(ABC):
         Args:
             data (dict | pandas.DataFrame | list): Data to dump
             file_name (str): File name
-            data_directory_path (str): Path to data directory
-            compress (bool, optional): Compress data. Defaults to False.
+            data_directory_path (str | os.PathLike): Path to data directory
+            compress (bool, optional): Compress data: zstd Parquet for DataFrames, zstd JSON for dicts,
+                pickle for anything else or when pyarrow/zstandard are missing. Defaults to False.
         """
 
-        if os.path.exists(data_directory_path):
+        # Directories already checked or created by this client are not looked up on disk again
+        if data_directory_path in self._dirs_created:
+            pass
+        elif os.path.exists(data_directory_path):
             print('📁 Data directory exists')
+            self._dirs_created.add(data_directory_path)
         elif (self.data_directory_path is not None) and os.path.exists(self.data_directory_path):
             data_directory_path = self.data_directory_path
         else:
             print('📁 New directory created')
-            os.mkdir(data_directory_path)
+            os.makedirs(data_directory_path, exist_ok=True)
+            self._dirs_created.add(data_directory_path)
 
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d')
+        timestamp = self._today()
         data_file_name = f"{file_name}_{timestamp}"
         extension = None
 
-        if compress:
-            extension = '.pkl'
-            pickle.dump(
-                data,
-                open(
-                    os.path.join(
-                        data_directory_path,
-                        data_file_name + extension,
-                    ),
-                    'wb',
+        if compress and PYARROW_AVAILABLE and isinstance(data, pandas.DataFrame):
+            extension = '.parquet'
+            pyarrow.parquet.write_table(
+                pyarrow.Table.from_pandas(data, preserve_index=False),
+                os.path.join(
+                    data_directory_path,
+                    data_file_name + extension,
                 ),
+                compression='zstd',
+                compression_level=3,
             )
+        elif compress and ZSTD_AVAILABLE and isinstance(data, dict):
+            extension = '.json.zst'
+            with open(
+                os.path.join(
+                    data_directory_path,
+                    data_file_name + extension,
+                ),
+                'wb',
+                buffering=DUMP_BUFFER_SIZE,
+            ) as f:
+                f.write(zstandard.ZstdCompressor(level=3).compress(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)))
+        elif compress:
+            # Anything the columnar/zstd formats above can't take (or without those extras) is pickled
+            extension = '.pkl'
+            with open(
+                os.path.join(
+                    data_directory_path,
+                    data_file_name + extension,
+                ),
+                'wb',
+                buffering=DUMP_BUFFER_SIZE,
+            ) as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
         elif isinstance(data, pandas.DataFrame):
             extension = '.csv'
-            data.to_csv(
+            with open(
                 os.path.join(
                     data_directory_path,
                     data_file_name + extension,
                 ),
-            )
+                'w',
+                newline='',
+                buffering=DUMP_BUFFER_SIZE,
+            ) as f:
+                data.to_csv(f)
         elif isinstance(data, dict):
             extension = '.json'
-            json.dump(
-                data,
-                open(
-                    os.path.join(
-                        data_directory_path,
-                        data_file_name + extension,
-                    ),
-                    'w',
+            with open(
+                os.path.join(
+                    data_directory_path,
+                    data_file_name + extension,
                 ),
-            )
+                'wb',
+                buffering=DUMP_BUFFER_SIZE,
+            ) as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
         else:
             extension = '.txt'
             with open(
@@ -128,19 +666,19 @@ class DataAPIClient(ABC):
                     data_file_name + extension,
                 ),
                 'w+',
+                buffering=DUMP_BUFFER_SIZE,
             ) as f:
                 f.write(data)
 
-    def set_data_directory_path(self, data_directory_path: str) -> None:
+    def set_data_directory_path(self, data_directory_path: str | os.PathLike) -> None:
         """_summary_
-        Set data directory path.
+        Set data directory path, resolved to an absolute path once and created if missing.
         Args:
-            data_diretory_path (str): Path to data directory
+            data_diretory_path (str | os.PathLike): Path to data directory
         """
-        if os.path.exists(data_directory_path):
-            self.data_directory_path = data_directory_path
-        else:
-            os.mkdir(data_directory_path)
-            self.data_directory_path = data_directory_path
+        data_directory_path = _resolve_directory(data_directory_path)
+        data_directory_path.mkdir(parents=True, exist_ok=True)
+        self._dirs_created.add(data_directory_path)
+        self.data_directory_path = data_directory_path
 
         print(f"📁 Data directory path set to {data_directory_path}")
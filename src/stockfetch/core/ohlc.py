@@ -0,0 +1,76 @@
+# Columnar container for OHLC history
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import fields
+
+import numpy as np
+import pandas
+
+
+@dataclass(slots=True)
+class OHLC:
+    """_summary_
+    OHLC history stored as one numpy array per column (struct of arrays), oldest row first.
+    A DataFrame is only built when to_pandas() is called.
+    """
+
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def empty(cls) -> OHLC:
+        """_summary_
+        OHLC history without rows.
+        Returns:
+            OHLC: Empty OHLC history
+        """
+        return cls(
+            timestamp=np.empty(0, dtype='datetime64[D]'),
+            open=np.empty(0),
+            high=np.empty(0),
+            low=np.empty(0),
+            close=np.empty(0),
+            volume=np.empty(0),
+        )
+
+    @classmethod
+    def from_pandas(cls, data: pandas.DataFrame, columns: dict[str, str]) -> OHLC:
+        """_summary_
+        Build OHLC history from a DataFrame of an API's raw rows, in any row order.
+        Args:
+            data (pandas.DataFrame): Raw OHLC rows
+            columns (dict[str, str]): OHLC field name -> column name in data
+
+        Returns:
+            OHLC: OHLC history in chronological order
+        """
+        if data.empty:
+            return cls.empty()
+        timestamp = data[columns['timestamp']].to_numpy().astype('datetime64[D]')
+        order = np.argsort(timestamp, kind='stable')
+        return cls(
+            timestamp=timestamp[order],
+            **{
+                name: data[columns[name]].to_numpy(dtype=np.float64)[order]
+                for name in ('open', 'high', 'low', 'close', 'volume')
+            },
+        )
+
+    def to_pandas(self) -> pandas.DataFrame:
+        """_summary_
+        OHLC history as a DataFrame, one column per field, sharing the arrays where pandas allows.
+        Returns:
+            pandas.DataFrame: OHLC data
+        """
+        return pandas.DataFrame(
+            {field.name: getattr(self, field.name) for field in fields(self)},
+            copy=False,
+        )
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-import os
-
 import stockfetch.api.NSE_Client as NSE_Client
+from stockfetch.core.data_api_client import DataAPIClient
+
+
+async def main():
+    async with NSE_Client.NSE_Client() as nse_client_instance:
+        symbol = 'DOMS'
+        start_date = '01-02-2024'
+        end_date = '01-05-2024'
+        # Resolved against the working directory once, then reused by every dump
+        nse_client_instance.set_data_directory_path('dumps')
+        df = await nse_client_instance.get_historical_ohlc_data(
+            symbol, start_date, end_date, dump=True,
+        )
+    await DataAPIClient.close_client()
+
+
 if __name__ == '__main__':
-    nse_client_instance = NSE_Client.NSE_Client()
-    symbol = 'DOMS'
-    start_date = '01-02-2024'
-    end_date = '01-05-2024'
-    data_directory_path = os.path.join(os.getcwd(), 'duops')
-    nse_client_instance.set_data_directory_path(data_directory_path)
-    df = nse_client_instance.get_historical_ohlc_data(
-        symbol, start_date, end_date, data_directory_path=os.path.join(
-            os.getcwd(), 'dumps',
-        ),
-    )
+    # libuv event loop when uvloop is installed (pip install stockfetch[uvloop]), asyncio's otherwise
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
+    run(main())